@@ -22,67 +22,114 @@ import re
 import json
 import configparser
 import os
+import threading
+import functools
+import atexit
+import tempfile
+import ctypes
+from ctypes import wintypes
+import heapq
+import bisect
+import collections
+import operator
 
 # --- GPU DETECTION LIBRARIES ---
+# The vendor libraries are imported on first use rather than at module load:
+# wmi starts COM, pynvml dlopens the NVIDIA driver and some GPUtil versions pull
+# in pandas, and most hosts only ever need one of them.
 try:
-    import wmi
+    import winreg  # Windows only (standard library)
 except ImportError:
-    wmi = None
+    winreg = None
+
+_lazy_modules = {}
+
+
+def _lazy_import(module_name, missing_msg=None):
+    """Import module_name once and cache it; returns None if it is not installed."""
+    if module_name not in _lazy_modules:
+        try:
+            _lazy_modules[module_name] = __import__(module_name)
+        except ImportError:
+            _lazy_modules[module_name] = None
+            if missing_msg:
+                print(f"INFO: {missing_msg}")
+    return _lazy_modules[module_name]
+
+
+def _load_wmi():
+    return _lazy_import('wmi')
+
+
+def _load_cpuinfo():
+    return _lazy_import('cpuinfo')
 
-try:
-    import cpuinfo
-except ImportError:
-    cpuinfo = None
 
 # NVIDIA GPU Support (pynvml)
-try:
-    from pynvml import nvmlInit, nvmlShutdown, nvmlDeviceGetCount, nvmlDeviceGetHandleByIndex, nvmlDeviceGetName, \
-                        nvmlDeviceGetUtilizationRates, nvmlDeviceGetTemperature, nvmlDeviceGetMemoryInfo, \
-                        nvmlDeviceGetPowerUsage, nvmlDeviceGetClockInfo, nvmlSystemGetDriverVersion, NVMLError, nvmlConstants as NVM
-    NVML_AVAILABLE = True
-except ImportError:
-    NVML_AVAILABLE = False
-    print("INFO: pynvml not found. NVIDIA GPU stats via NVML will be unavailable.")
+def _load_pynvml():
+    return _lazy_import('pynvml', "pynvml not found. NVIDIA GPU stats via NVML will be unavailable.")
+
 
 # GPUtil for cross-platform GPU detection
-try:
-    import GPUtil
-    GPUTIL_AVAILABLE = True
-except ImportError:
-    GPUTIL_AVAILABLE = False
-    print("INFO: GPUtil not found. Fallback GPU detection will be limited.")
+def _load_gputil():
+    return _lazy_import('GPUtil', "GPUtil not found. Fallback GPU detection will be limited.")
+
 
 # AMD GPU Support (pyamdgpuinfo for Linux)
-try:
-    import pyamdgpuinfo
-    PYAMDGPUINFO_AVAILABLE = True
-except ImportError:
-    PYAMDGPUINFO_AVAILABLE = False
-    print("INFO: pyamdgpuinfo not found. AMD GPU monitoring on Linux will be unavailable.")
+def _load_pyamdgpuinfo():
+    return _lazy_import('pyamdgpuinfo', "pyamdgpuinfo not found. AMD GPU monitoring on Linux will be unavailable.")
+
 
 # AMD GPU Support (pyadl for Windows)
-try:
-    from pyadl import ADLManager
-    PYADL_AVAILABLE = True
-except ImportError:
-    PYADL_AVAILABLE = False
-    print("INFO: pyadl not found. AMD GPU monitoring on Windows will be limited.")
+def _load_pyadl():
+    return _lazy_import('pyadl', "pyadl not found. AMD GPU monitoring on Windows will be limited.")
+
+# NVML is initialized at most once per process and shut down from atexit;
+# repeated nvmlInit/nvmlShutdown cycles are expensive.
+_nvml_initialized = False
+
+
+def _safe_nvml_shutdown():
+    global _nvml_initialized
+    if _nvml_initialized:
+        _nvml_initialized = False
+        try:
+            _load_pynvml().nvmlShutdown()
+        except Exception as e:
+            print(f"NVML shutdown failed: {e}")
+
+
+def _nvml_str(value):
+    """NVML string results: bytes from old pynvml releases, str from nvidia-ml-py."""
+    return value.decode('utf-8') if isinstance(value, bytes) else value
 
 # ----------------------------------
 # PyQt6 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QMessageBox, QListWidget, QStackedWidget, 
-    QGridLayout, QPushButton, QTableWidget, QTableWidgetItem, 
-    QHeaderView, QSizePolicy, QGroupBox, QScrollArea, QDialog
+    QGridLayout, QPushButton, QTableView, 
+    QHeaderView, QSizePolicy, QGroupBox, QScrollArea, QDialog, QStyledItemDelegate, QStyle
 )
-from PyQt6.QtCore import Qt, QPoint, QTimer, QSize, QRectF, QThread, pyqtSignal, QUrl, QByteArray, QLocale, QDate, QTime, QSize, QRect, QBuffer, QIODevice
-from PyQt6.QtGui import QIcon, QFont, QScreen, QPainter, QPen, QColor, QBrush, QConicalGradient, QMovie
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply # Networking imports for GIF fetching
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QEvent, QPoint, QTimer, QSize, QRectF, QThread, pyqtSignal, QUrl, QByteArray, QLocale, QDate, QTime, QSize, QRect, QBuffer, QIODevice, QUrlQuery, QThreadPool
+from PyQt6.QtGui import QIcon, QFont, QScreen, QPainter, QPen, QColor, QBrush, QConicalGradient, QMovie, QPixmap, QImageReader
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply, QNetworkDiskCache # Networking imports for GIF fetching
 
 from screeninfo import get_monitors
 import getpass
 
+# Directory of this script; __file__ is already absolute when run as a script
+_SCRIPT_DIR = os.path.dirname(__file__)
+
+# Host facts that cannot change while the app runs, read once at import
+SYSTEM = platform.system()
+HOSTNAME = platform.node()
+try:
+    USER = getpass.getuser()
+except Exception:
+    USER = "N/A"
+
+
 def load_settings():
     """
     Load settings from settings.ini file in the script's directory.
@@ -93,20 +140,13 @@ def load_settings():
         'config_resolution': None  # Default to None (auto-detect smallest monitor)
     }
     
-    # Get the directory where the script is running
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    settings_path = os.path.join(script_dir, 'settings.ini')
-    
-    # Check if settings.ini exists
-    if not os.path.exists(settings_path):
-        print(f"INFO: settings.ini not found at {settings_path}")
-        print("INFO: Using default settings. Creating sample settings.ini...")
-        create_sample_settings(settings_path)
-        return settings
+    settings_path = os.path.join(_SCRIPT_DIR, 'settings.ini')
     
     try:
         config = configparser.ConfigParser()
-        config.read(settings_path)
+        # A single open() both checks for and reads the file
+        with open(settings_path, encoding='utf-8') as settings_file:
+            config.read_file(settings_file)
         
         # Read GIPHY API Key
         if config.has_option('API', 'giphy_api_key'):
@@ -122,6 +162,11 @@ def load_settings():
                 settings['config_resolution'] = resolution
                 print(f"INFO: Loaded target resolution from settings.ini: {resolution}")
         
+    except FileNotFoundError:
+        print(f"INFO: settings.ini not found at {settings_path}")
+        print("INFO: Using default settings. Creating sample settings.ini...")
+        # Written in the background so a slow disk doesn't delay showing the window
+        threading.Thread(target=create_sample_settings, args=(settings_path,), daemon=True).start()
     except Exception as e:
         print(f"WARNING: Error reading settings.ini: {e}")
         print("INFO: Using default settings")
@@ -155,6 +200,122 @@ def create_sample_settings(settings_path):
         
 # --- GPU Detection Class ---
 
+# Byte-size shifts (1 MB = 1 << 20, 1 GB = 1 << 30)
+_MB_SHIFT = 20
+_GB_SHIFT = 30
+_GIB = 1 << _GB_SHIFT
+
+
+def _to_gb_tenths(value, shift=_GB_SHIFT):
+    """Convert an integer size to GB rounded to one decimal (shift=10 for MB input)."""
+    return ((int(value) * 10 + (1 << (shift - 1))) >> shift) / 10
+
+# First VGA/3D controller line of `lspci` output
+_LSPCI_LINE_RE = re.compile(r'^(.*(?:VGA|3D).*)$', re.M)
+
+# GPU vendor keywords, one named group per vendor
+_VENDOR_RE = re.compile(
+    r'\b(?:(?P<nvidia>nvidia|geforce|quadro|tesla)|(?P<amd>amd|radeon|rx \d)'
+    r'|(?P<intel>intel|arc\b|iris)|(?P<apple>apple))', re.I)
+_VENDOR_TYPES = {'nvidia': "NVIDIA", 'amd': "AMD", 'intel': "Intel", 'apple': "Apple"}
+
+
+def _classify_vendor(name):
+    """Map a GPU name to its vendor type ("NVIDIA", "AMD", "Intel", "Apple" or "Generic")."""
+    match = _VENDOR_RE.search(name or '')
+    if not match:
+        return "Generic"
+    return _VENDOR_TYPES[match.lastgroup]
+
+# sysfs/pci.ids lookup used on Linux before falling back to spawning lspci
+_DRM_CARD_RE = re.compile(r'card(\d+)$')
+_PCI_VENDOR_TYPES = {'0x10de': "NVIDIA", '0x1002': "AMD", '0x8086': "Intel"}
+_PCI_IDS_PATHS = ('/usr/share/hwdata/pci.ids', '/usr/share/misc/pci.ids', '/usr/share/pci.ids')
+
+
+def _read_sysfs_value(path):
+    with open(path) as f:
+        return f.read().strip()
+
+
+def _lookup_pci_name(vendor_id, device_id):
+    """
+    Resolve PCI ids (e.g. '0x10de', '0x2206') to a 'Vendor Model' string using
+    the same pci.ids database lspci reads. Returns None if no database is found.
+    """
+    vendor_id = vendor_id.lower().replace('0x', '')
+    device_id = device_id.lower().replace('0x', '')
+    
+    for path in _PCI_IDS_PATHS:
+        try:
+            with open(path, encoding='utf-8', errors='replace') as f:
+                vendor_name = None
+                for line in f:
+                    if vendor_name is None:
+                        # Vendor lines look like "10de  NVIDIA Corporation"
+                        if line.startswith(vendor_id + '  '):
+                            vendor_name = line[len(vendor_id):].strip()
+                    elif line.startswith('\t\t') or line.startswith('#') or not line.strip():
+                        continue  # Subsystem entries and comments
+                    elif line.startswith('\t'):
+                        # Device lines look like "\t2206  GA102 [GeForce RTX 3080]"
+                        if line[1:5] == device_id:
+                            return f"{vendor_name} {line[5:].strip()}"
+                    else:
+                        break  # Reached the next vendor; device is not listed
+                if vendor_name:
+                    return vendor_name
+        except OSError:
+            continue
+    return None
+
+
+def _read_linux_drm_gpu():
+    """
+    Find the first display-class PCI device under /sys/class/drm using plain
+    file reads (no subprocess). Returns (gpu_type, gpu_name) or None.
+    """
+    try:
+        cards = [name for name in os.listdir('/sys/class/drm') if _DRM_CARD_RE.match(name)]
+    except OSError:
+        return None
+    
+    for card in sorted(cards, key=lambda name: int(_DRM_CARD_RE.match(name).group(1))):
+        device_dir = os.path.join('/sys/class/drm', card, 'device')
+        try:
+            # PCI class 0x03xxxx = display controller (VGA, 3D, other)
+            if not _read_sysfs_value(os.path.join(device_dir, 'class')).startswith('0x03'):
+                continue
+            vendor_id = _read_sysfs_value(os.path.join(device_dir, 'vendor'))
+            device_id = _read_sysfs_value(os.path.join(device_dir, 'device'))
+        except OSError:
+            continue  # Not a PCI device (e.g. simpledrm) or unreadable
+        
+        gpu_type = _PCI_VENDOR_TYPES.get(vendor_id.lower(), "Generic")
+        gpu_name = _lookup_pci_name(vendor_id, device_id) or f"{gpu_type} GPU [{vendor_id[2:]}:{device_id[2:]}]"
+        return gpu_type, gpu_name
+    return None
+
+
+# Windows display adapter device class (GUID_DEVCLASS_DISPLAY)
+_DISPLAY_ADAPTER_CLASS_KEY = r'SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}'
+
+
+def _query_registry_value(key, name):
+    """Returns a registry value's data, or None if it is missing."""
+    try:
+        return winreg.QueryValueEx(key, name)[0]
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _system_profiler_displays():
+    """Output of `system_profiler SPDisplaysDataType`; spawned at most once per process."""
+    return subprocess.run(['system_profiler', 'SPDisplaysDataType'],
+                          capture_output=True, text=True).stdout
+
+
 class GPUDetector:
     """
     Universal GPU detector that supports NVIDIA, AMD, Intel, and other GPUs
@@ -166,17 +327,43 @@ class GPUDetector:
         self.gpu_memory = 0
         self.driver_version = "N/A"
         self.can_monitor = False
+        self._nvml = None  # pynvml module, set once NVML detection succeeds
         self.nvml_handle = None
+        self._nvml_fields = []  # (field_id, stats_key, divisor) read via nvmlDeviceGetFieldValues
         self.amd_device = None
         self.amd_manager = None
+        self._amd_pyadl_device = None  # Cached pyadl device (avoids re-enumeration per tick)
+        self._gputil_gpu = None  # Cached GPUtil device from detection
+        self._vram_total_mb = 0  # Exact total reported by a monitoring backend
+        
+        # Short-lived cache so callers polling in the same tick share one query
+        self._last_stats = None
+        self._last_stats_ts = 0.0
+        self._stats_ttl = 0.25  # seconds
         
         self._detect_gpu()
+        
+        # Static fields never change at runtime, so they are computed once and
+        # only the dynamic keys are filled in by get_live_stats()
+        if not self._vram_total_mb:
+            self._vram_total_mb = int(self.gpu_memory * 1024)  # Only the rounded GB is known
+        self._static_stats_template = {
+            'load': 0,
+            'temp': 0,
+            'vram_used': 0,
+            'vram_total': self._vram_total_mb,
+            'core_clock': 0,
+            'mem_clock': 0,
+            'power': 0
+        }
+        # Filled in place on every query instead of allocating a new dict per tick
+        self._stats = self._static_stats_template.copy()
     
     def _detect_gpu(self):
         """Try multiple detection methods in order of preference."""
         
         # Method 1: Try NVIDIA NVML first (most detailed for NVIDIA)
-        if NVML_AVAILABLE and self._try_nvidia_nvml():
+        if self._try_nvidia_nvml():
             return
         
         # Method 2: Try AMD-specific libraries
@@ -184,14 +371,18 @@ class GPUDetector:
             return
         
         # Method 3: Try GPUtil (cross-platform, works for NVIDIA and some AMD)
-        if GPUTIL_AVAILABLE and self._try_gputil():
+        if self._try_gputil():
+            return
+        
+        # Method 4: Read the display adapter registry keys on Windows (no COM startup cost)
+        if winreg and self._try_registry():
             return
         
-        # Method 4: Try WMI on Windows (works for all GPU types)
-        if wmi and platform.system() == 'Windows' and self._try_wmi():
+        # Method 5: Try WMI on Windows (works for all GPU types, slow cold start)
+        if SYSTEM == 'Windows' and self._try_wmi():
             return
         
-        # Method 5: Try OpenCL/system commands (Linux/Mac fallback)
+        # Method 6: Try OpenCL/system commands (Linux/Mac fallback)
         if self._try_system_detection():
             return
         
@@ -199,35 +390,54 @@ class GPUDetector:
     
     def _try_nvidia_nvml(self):
         """Attempt to detect NVIDIA GPU using NVML."""
+        global _nvml_initialized
+        nvml = _load_pynvml()
+        if nvml is None:
+            return False
         try:
-            nvmlInit()
-            if nvmlDeviceGetCount() > 0:
-                self.nvml_handle = nvmlDeviceGetHandleByIndex(0)
-                self.gpu_name = nvmlDeviceGetName(self.nvml_handle).decode('utf-8')
+            if not _nvml_initialized:
+                nvml.nvmlInit()
+                _nvml_initialized = True
+                atexit.register(_safe_nvml_shutdown)
+            if nvml.nvmlDeviceGetCount() > 0:
+                self._nvml = nvml
+                # Bound once so the per-tick stats path skips the attribute lookups
+                self._nvml_temp_sensor = nvml.NVML_TEMP_GPU
+                self._nvml_clocks = (
+                    (nvml.NVML_CLOCK_GRAPHICS, nvml.NVML_CLOCK_ID_CURRENT),
+                    (nvml.NVML_CLOCK_MEM, nvml.NVML_CLOCK_ID_CURRENT),
+                )
+                
+                self.nvml_handle = nvml.nvmlDeviceGetHandleByIndex(0)
+                self.gpu_name = _nvml_str(nvml.nvmlDeviceGetName(self.nvml_handle))
                 self.gpu_type = "NVIDIA"
                 
-                mem = nvmlDeviceGetMemoryInfo(self.nvml_handle)
-                self.gpu_memory = round(mem.total / (1024**3), 1)
+                mem = nvml.nvmlDeviceGetMemoryInfo(self.nvml_handle)
+                self.gpu_memory = _to_gb_tenths(mem.total)
+                self._vram_total_mb = mem.total >> _MB_SHIFT
                 
-                self.driver_version = nvmlSystemGetDriverVersion().decode('utf-8')
+                self.driver_version = _nvml_str(nvml.nvmlSystemGetDriverVersion())
                 self.can_monitor = True
                 
+                # NVML's field-value API only covers some of the live stats
+                # (no utilization, memory or clock fields), so the rest keep
+                # their dedicated calls. Older bindings (pre driver R450) lack it.
+                power_field = getattr(nvml, 'NVML_FI_DEV_POWER_INSTANT', None)
+                if power_field is not None and hasattr(nvml, 'nvmlDeviceGetFieldValues'):
+                    self._nvml_fields = [(power_field, 'power', 1000)]  # mW -> W
+                
                 print(f"SUCCESS: Detected NVIDIA GPU via NVML: {self.gpu_name}")
                 return True
         except Exception as e:
             print(f"NVML detection failed: {e}")
-            if NVML_AVAILABLE:
-                try:
-                    nvmlShutdown()
-                except:
-                    pass
         return False
     
     def _try_amd_monitoring(self):
         """Attempt to detect and enable AMD GPU monitoring."""
         
         # Try pyamdgpuinfo (Linux)
-        if PYAMDGPUINFO_AVAILABLE and platform.system() == 'Linux':
+        pyamdgpuinfo = _load_pyamdgpuinfo() if SYSTEM == 'Linux' else None
+        if pyamdgpuinfo:
             try:
                 pyamdgpuinfo.detect_gpus()
                 num_gpus = pyamdgpuinfo.get_gpu_count()
@@ -240,7 +450,8 @@ class GPUDetector:
                     # Get memory info
                     try:
                         vram_size = self.amd_device.query_vram_size()
-                        self.gpu_memory = round(vram_size / (1024**3), 1)
+                        self.gpu_memory = _to_gb_tenths(vram_size)
+                        self._vram_total_mb = vram_size >> _MB_SHIFT
                     except:
                         self.gpu_memory = 0
                     
@@ -257,20 +468,23 @@ class GPUDetector:
                 print(f"pyamdgpuinfo detection failed: {e}")
         
         # Try pyadl (Windows)
-        if PYADL_AVAILABLE and platform.system() == 'Windows':
+        pyadl = _load_pyadl() if SYSTEM == 'Windows' else None
+        if pyadl:
             try:
-                self.amd_manager = ADLManager.getInstance()
+                self.amd_manager = pyadl.ADLManager.getInstance()
                 devices = self.amd_manager.getDevices()
                 
                 if devices:
                     device = devices[0]
+                    self._amd_pyadl_device = device
                     self.gpu_name = device.adapterName
                     self.gpu_type = "AMD"
                     
                     # Get memory info (in MB, convert to GB)
                     try:
                         mem_info = device.getCurrentMemoryInfo()
-                        self.gpu_memory = round(mem_info['total'] / 1024, 1)
+                        self.gpu_memory = _to_gb_tenths(mem_info['total'], 10)
+                        self._vram_total_mb = int(mem_info['total'])
                     except:
                         self.gpu_memory = 0
                     
@@ -290,23 +504,20 @@ class GPUDetector:
     
     def _try_gputil(self):
         """Attempt to detect GPU using GPUtil."""
+        GPUtil = _load_gputil()
+        if GPUtil is None:
+            return False
         try:
             gpus = GPUtil.getGPUs()
             if gpus:
                 gpu = gpus[0]
+                self._gputil_gpu = gpu
                 self.gpu_name = gpu.name
-                self.gpu_memory = round(gpu.memoryTotal / 1024, 1)  # Convert MB to GB
+                self.gpu_memory = _to_gb_tenths(gpu.memoryTotal, 10)  # Convert MB to GB
+                self._vram_total_mb = int(gpu.memoryTotal)
                 self.driver_version = gpu.driver if hasattr(gpu, 'driver') else "N/A"
                 
-                # Determine vendor
-                if 'nvidia' in self.gpu_name.lower():
-                    self.gpu_type = "NVIDIA"
-                elif 'amd' in self.gpu_name.lower() or 'radeon' in self.gpu_name.lower():
-                    self.gpu_type = "AMD"
-                elif 'intel' in self.gpu_name.lower():
-                    self.gpu_type = "Intel"
-                else:
-                    self.gpu_type = "Generic"
+                self.gpu_type = _classify_vendor(self.gpu_name)
                 
                 self.can_monitor = True
                 print(f"SUCCESS: Detected GPU via GPUtil: {self.gpu_name} ({self.gpu_type})")
@@ -315,8 +526,69 @@ class GPUDetector:
             print(f"GPUtil detection failed: {e}")
         return False
     
+    def _try_registry(self):
+        """
+        Attempt to detect GPU from the display adapter class key in the registry (Windows only).
+        The key keeps entries for adapters whose driver was installed once, so
+        entries without a bound device are skipped and, of the rest, the one
+        with the most memory (normally the discrete GPU) is reported.
+        """
+        try:
+            best = None  # (memory, name, driver_version)
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, _DISPLAY_ADAPTER_CLASS_KEY) as class_key:
+                index = 0
+                while True:
+                    try:
+                        subkey_name = winreg.EnumKey(class_key, index)
+                    except OSError:
+                        break  # No more adapters
+                    index += 1
+                    
+                    # Adapters live under 0000, 0001, ...; skip "Properties" and friends
+                    if not subkey_name.isdigit():
+                        continue
+                    
+                    try:
+                        with winreg.OpenKey(class_key, subkey_name) as adapter_key:
+                            name = winreg.QueryValueEx(adapter_key, 'DriverDesc')[0]
+                            if name.startswith("Microsoft Basic"):
+                                continue  # Fallback display/render driver, not a real GPU
+                            if not _query_registry_value(adapter_key, 'MatchingDeviceId'):
+                                continue  # Leftover driver entry with no device bound to it
+                            
+                            memory = _query_registry_value(adapter_key, 'HardwareInformation.qwMemorySize')
+                            if memory is None:
+                                memory = _query_registry_value(adapter_key, 'HardwareInformation.MemorySize')
+                            if isinstance(memory, bytes):
+                                memory = int.from_bytes(memory, 'little')
+                            
+                            driver_version = _query_registry_value(adapter_key, 'DriverVersion')
+                    except OSError:
+                        continue  # Access denied or no DriverDesc
+                    
+                    if best is None or (memory or 0) > best[0]:
+                        best = (memory or 0, name, driver_version)
+            
+            if best is not None:
+                memory, self.gpu_name, driver_version = best
+                if memory:
+                    self.gpu_memory = _to_gb_tenths(memory)
+                if driver_version:
+                    self.driver_version = driver_version
+                self.gpu_type = _classify_vendor(self.gpu_name)
+                
+                self.can_monitor = False  # The registry only holds static adapter info
+                print(f"SUCCESS: Detected GPU via registry: {self.gpu_name} ({self.gpu_type})")
+                return True
+        except Exception as e:
+            print(f"Registry GPU detection failed: {e}")
+        return False
+    
     def _try_wmi(self):
         """Attempt to detect GPU using WMI (Windows only)."""
+        wmi = _load_wmi()
+        if wmi is None:
+            return False
         try:
             c = wmi.WMI()
             gpus = c.Win32_VideoController()
@@ -327,22 +599,13 @@ class GPUDetector:
                 
                 # Try to get memory (in bytes, convert to GB)
                 if hasattr(gpu, 'AdapterRAM') and gpu.AdapterRAM:
-                    self.gpu_memory = round(int(gpu.AdapterRAM) / (1024**3), 1)
+                    self.gpu_memory = _to_gb_tenths(gpu.AdapterRAM)
                 
                 # Get driver version
                 if hasattr(gpu, 'DriverVersion'):
                     self.driver_version = gpu.DriverVersion
                 
-                # Determine vendor
-                name_lower = self.gpu_name.lower()
-                if 'nvidia' in name_lower or 'geforce' in name_lower or 'quadro' in name_lower:
-                    self.gpu_type = "NVIDIA"
-                elif 'amd' in name_lower or 'radeon' in name_lower:
-                    self.gpu_type = "AMD"
-                elif 'intel' in name_lower:
-                    self.gpu_type = "Intel"
-                else:
-                    self.gpu_type = "Generic"
+                self.gpu_type = _classify_vendor(self.gpu_name)
                 
                 self.can_monitor = False  # WMI doesn't provide real-time monitoring
                 print(f"SUCCESS: Detected GPU via WMI: {self.gpu_name} ({self.gpu_type})")
@@ -355,42 +618,30 @@ class GPUDetector:
         """Try system-specific commands to detect GPU."""
         try:
             # Linux: Try lspci
-            if platform.system() == 'Linux':
+            if SYSTEM == 'Linux':
+                # sysfs first: plain file reads instead of a fork+exec
+                drm_gpu = _read_linux_drm_gpu()
+                if drm_gpu:
+                    self.gpu_type, self.gpu_name = drm_gpu
+                    print(f"SUCCESS: Detected GPU via sysfs: {self.gpu_name} ({self.gpu_type})")
+                    return True
+                
                 result = subprocess.run(['lspci'], capture_output=True, text=True)
-                for line in result.stdout.split('\n'):
-                    if 'VGA' in line or '3D' in line:
-                        self.gpu_name = line.split(':')[-1].strip()
-                        
-                        name_lower = self.gpu_name.lower()
-                        if 'nvidia' in name_lower:
-                            self.gpu_type = "NVIDIA"
-                        elif 'amd' in name_lower or 'radeon' in name_lower:
-                            self.gpu_type = "AMD"
-                        elif 'intel' in name_lower:
-                            self.gpu_type = "Intel"
-                        else:
-                            self.gpu_type = "Generic"
-                        
-                        print(f"SUCCESS: Detected GPU via lspci: {self.gpu_name} ({self.gpu_type})")
-                        return True
+                match = _LSPCI_LINE_RE.search(result.stdout)
+                if match:
+                    # "01:00.0 VGA compatible controller: <vendor and model>"
+                    self.gpu_name = match.group(1).split(':', 2)[-1].strip()
+                    self.gpu_type = _classify_vendor(self.gpu_name)
+                    
+                    print(f"SUCCESS: Detected GPU via lspci: {self.gpu_name} ({self.gpu_type})")
+                    return True
             
             # macOS: Try system_profiler
-            elif platform.system() == 'Darwin':
-                result = subprocess.run(['system_profiler', 'SPDisplaysDataType'], 
-                                      capture_output=True, text=True)
-                match = re.search(r'Chipset Model: (.+)', result.stdout)
+            elif SYSTEM == 'Darwin':
+                match = re.search(r'Chipset Model: (.+)', _system_profiler_displays())
                 if match:
                     self.gpu_name = match.group(1).strip()
-                    
-                    name_lower = self.gpu_name.lower()
-                    if 'nvidia' in name_lower:
-                        self.gpu_type = "NVIDIA"
-                    elif 'amd' in name_lower or 'radeon' in name_lower:
-                        self.gpu_type = "AMD"
-                    elif 'intel' in name_lower or 'apple' in name_lower:
-                        self.gpu_type = "Intel/Apple"
-                    else:
-                        self.gpu_type = "Generic"
+                    self.gpu_type = _classify_vendor(self.gpu_name)
                     
                     print(f"SUCCESS: Detected GPU via system_profiler: {self.gpu_name} ({self.gpu_type})")
                     return True
@@ -399,49 +650,82 @@ class GPUDetector:
         
         return False
     
+    def _read_nvml_fields(self, stats):
+        """
+        Read all batched NVML fields in a single nvmlDeviceGetFieldValues call.
+        Returns False if the batched API is unavailable or a field was rejected
+        by the device so the caller can fall back to the per-attribute queries.
+        """
+        if not self._nvml_fields:
+            return False
+        try:
+            values = self._nvml.nvmlDeviceGetFieldValues(self.nvml_handle, [field[0] for field in self._nvml_fields])
+        except self._nvml.NVMLError as e:
+            # Older drivers: stop trying the batched path
+            print(f"NVML field values unavailable, using per-attribute queries: {e}")
+            self._nvml_fields = []
+            return False
+        
+        unsupported = []
+        for field, value in zip(self._nvml_fields, values):
+            if value.nvmlReturn == self._nvml.NVML_SUCCESS:
+                _, key, divisor = field
+                stats[key] = value.value.uiVal / divisor
+            else:
+                unsupported.append(field)
+        
+        if unsupported:
+            # The device rejected some fields (e.g. no instant power sensor):
+            # leave them to the per-attribute queries from now on
+            print(f"NVML fields not supported, using per-attribute queries: {[field[1] for field in unsupported]}")
+            self._nvml_fields = [field for field in self._nvml_fields if field not in unsupported]
+            return False
+        return True
+    
     def get_live_stats(self):
         """
         Get live GPU statistics if monitoring is available.
         Returns dict with: load, temp, vram_used, vram_total, core_clock, mem_clock, power
+        Results are reused for up to self._stats_ttl seconds. The same dict is
+        updated in place on every query, so copy it before keeping it around.
         """
-        stats = {
-            'load': 0,
-            'temp': 0,
-            'vram_used': 0,
-            'vram_total': self.gpu_memory * 1024,  # Convert GB to MB
-            'core_clock': 0,
-            'mem_clock': 0,
-            'power': 0
-        }
+        now = time.monotonic()
+        if self._last_stats is not None and now - self._last_stats_ts < self._stats_ttl:
+            return self._last_stats
+        
+        stats = self._stats
+        stats.update(self._static_stats_template)  # Reset values a failed query would leave stale
         
         if not self.can_monitor:
             return stats
         
         # NVIDIA NVML monitoring
         if self.gpu_type == "NVIDIA" and self.nvml_handle:
+            nvml = self._nvml
             try:
-                util = nvmlDeviceGetUtilizationRates(self.nvml_handle)
+                util = nvml.nvmlDeviceGetUtilizationRates(self.nvml_handle)
                 stats['load'] = util.gpu
                 
-                stats['temp'] = nvmlDeviceGetTemperature(self.nvml_handle, NVM.NVML_TEMP_GPU)
+                stats['temp'] = nvml.nvmlDeviceGetTemperature(self.nvml_handle, self._nvml_temp_sensor)
                 
-                mem = nvmlDeviceGetMemoryInfo(self.nvml_handle)
-                stats['vram_used'] = mem.used // (1024**2)
-                stats['vram_total'] = mem.total // (1024**2)
+                mem = nvml.nvmlDeviceGetMemoryInfo(self.nvml_handle)
+                stats['vram_used'] = mem.used >> _MB_SHIFT
                 
-                try:
-                    stats['power'] = nvmlDeviceGetPowerUsage(self.nvml_handle) / 1000
-                except:
-                    stats['power'] = 0
+                if not self._read_nvml_fields(stats):
+                    try:
+                        stats['power'] = nvml.nvmlDeviceGetPowerUsage(self.nvml_handle) / 1000
+                    except:
+                        stats['power'] = 0
                 
-                stats['core_clock'] = nvmlDeviceGetClockInfo(self.nvml_handle, NVM.NVML_CLOCK_GRAPHICS, NVM.NVML_CLOCK_ID_CURRENT)
-                stats['mem_clock'] = nvmlDeviceGetClockInfo(self.nvml_handle, NVM.NVML_CLOCK_MEM, NVM.NVML_CLOCK_ID_CURRENT)
+                graphics_clock, memory_clock = self._nvml_clocks
+                stats['core_clock'] = nvml.nvmlDeviceGetClockInfo(self.nvml_handle, *graphics_clock)
+                stats['mem_clock'] = nvml.nvmlDeviceGetClockInfo(self.nvml_handle, *memory_clock)
                 
             except Exception as e:
                 print(f"Error fetching NVIDIA stats: {e}")
         
         # AMD pyamdgpuinfo monitoring (Linux)
-        elif self.gpu_type == "AMD" and self.amd_device and PYAMDGPUINFO_AVAILABLE:
+        elif self.gpu_type == "AMD" and self.amd_device:
             try:
                 # GPU Load
                 stats['load'] = self.amd_device.query_load() * 100
@@ -451,9 +735,7 @@ class GPUDetector:
                 
                 # VRAM usage
                 vram_used = self.amd_device.query_vram_used()
-                vram_total = self.amd_device.query_vram_size()
-                stats['vram_used'] = vram_used // (1024**2)
-                stats['vram_total'] = vram_total // (1024**2)
+                stats['vram_used'] = vram_used >> _MB_SHIFT
                 
                 # Clock speeds
                 try:
@@ -472,64 +754,74 @@ class GPUDetector:
                 print(f"Error fetching AMD stats (pyamdgpuinfo): {e}")
         
         # AMD pyadl monitoring (Windows)
-        elif self.gpu_type == "AMD" and self.amd_manager and PYADL_AVAILABLE:
+        elif self.gpu_type == "AMD" and self._amd_pyadl_device:
+            # Reuse the device found at detection instead of re-enumerating adapters every tick
+            device = self._amd_pyadl_device
             try:
-                devices = self.amd_manager.getDevices()
-                if devices:
-                    device = devices[0]
-                    
-                    # GPU Load
-                    try:
-                        stats['load'] = device.getCurrentUsage()
-                    except:
-                        pass
-                    
-                    # Temperature
-                    try:
-                        stats['temp'] = device.getCurrentTemperature()
-                    except:
-                        pass
-                    
-                    # VRAM usage
-                    try:
-                        mem_info = device.getCurrentMemoryInfo()
-                        stats['vram_used'] = mem_info['used']
-                        stats['vram_total'] = mem_info['total']
-                    except:
-                        pass
-                    
-                    # Clock speeds
-                    try:
-                        core_clock = device.getCurrentCoreClock()
-                        mem_clock = device.getCurrentMemoryClock()
-                        stats['core_clock'] = core_clock
-                        stats['mem_clock'] = mem_clock
-                    except:
-                        pass
+                # GPU Load
+                try:
+                    stats['load'] = device.getCurrentUsage()
+                except:
+                    pass
+                
+                # Temperature
+                try:
+                    stats['temp'] = device.getCurrentTemperature()
+                except:
+                    pass
+                
+                # VRAM usage
+                try:
+                    mem_info = device.getCurrentMemoryInfo()
+                    stats['vram_used'] = mem_info['used']
+                except:
+                    pass
+                
+                # Clock speeds
+                try:
+                    core_clock = device.getCurrentCoreClock()
+                    mem_clock = device.getCurrentMemoryClock()
+                    stats['core_clock'] = core_clock
+                    stats['mem_clock'] = mem_clock
+                except:
+                    pass
                 
             except Exception as e:
                 print(f"Error fetching AMD stats (pyadl): {e}")
         
         # GPUtil monitoring (works for NVIDIA and some AMD)
-        elif GPUTIL_AVAILABLE:
+        elif self._gputil_gpu:
+            GPUtil = _load_gputil()
             try:
+                # GPUtil devices are snapshots with no refresh method, so only the
+                # dynamic fields are re-read; the total comes from the static template.
                 gpus = GPUtil.getGPUs()
-                if gpus:
-                    gpu = gpus[0]
-                    stats['load'] = gpu.load * 100
-                    stats['temp'] = gpu.temperature
-                    stats['vram_used'] = gpu.memoryUsed
-                    stats['vram_total'] = gpu.memoryTotal
+                gpu = gpus[0] if gpus else self._gputil_gpu
+                stats['load'] = gpu.load * 100
+                stats['temp'] = gpu.temperature
+                stats['vram_used'] = gpu.memoryUsed
             except Exception as e:
                 print(f"Error fetching GPUtil stats: {e}")
         
+        self._last_stats = stats
+        self._last_stats_ts = now
         return stats
-
+    
 # Initialize GPU detector
 gpu_detector = GPUDetector()
 
 # --- Helper Functions (Monitor Detection) ---
 
+@functools.lru_cache(maxsize=8)
+def _parse_res(resolution_str):
+    """Parse a "WIDTHxHEIGHT" string into an (int, int) tuple, or None if malformed."""
+    try:
+        width, height = map(int, resolution_str.lower().split('x'))
+    except ValueError:
+        return None
+    return width, height
+
+
 def find_target_monitor(resolution_str=None):
     """
     Finds the target monitor based on a configured resolution or falls back 
@@ -547,28 +839,20 @@ def find_target_monitor(resolution_str=None):
         return None
 
     if resolution_str:
-        try:
-            target_width, target_height = map(int, resolution_str.lower().split('x'))
+        target_res = _parse_res(resolution_str)
+        if target_res:
             for monitor in monitors:
-                if monitor.width == target_width and monitor.height == target_height:
+                if (monitor.width, monitor.height) == target_res:
                     print(f"MATCH: Found configured resolution {resolution_str} at ({monitor.x}, {monitor.y}).")
                     return monitor
             print(f"WARNING: Configured resolution '{resolution_str}' not found. Falling back to smallest monitor.")
-        except ValueError:
+        else:
             print(f"WARNING: Configuration resolution format '{resolution_str}' is invalid. Falling back to smallest monitor.")
 
     # Fallback to finding smallest area
-    smallest_area = float('inf')
-    target_monitor = None
-    
-    for monitor in monitors:
-        area = monitor.width * monitor.height
-        if area < smallest_area:
-            smallest_area = area
-            target_monitor = monitor
-            
-    if target_monitor:
-        print(f"FALLBACK: Targeting smallest screen: {target_monitor.width}x{target_monitor.height} (Area: {smallest_area:,}).")
+    target_monitor = min(monitors, key=lambda m: m.width * m.height)
+    smallest_area = target_monitor.width * target_monitor.height
+    print(f"FALLBACK: Targeting smallest screen: {target_monitor.width}x{target_monitor.height} (Area: {smallest_area:,}).")
     return target_monitor
 
 # --- Icon Map (Using basic text/symbols for lack of font-awesome) ---
@@ -587,10 +871,61 @@ ICON_MAP = {
     "fullscreen": "🖼️"
 }
 
+# --- Button Styles ---
+
+@functools.lru_cache(maxsize=64)
+def _shade(hex_color, factor, mode):
+    """Returns hex_color lightened or darkened by factor (mode 'lighter' or 'darker') as "#rrggbb"."""
+    color = QColor(hex_color)
+    return (color.lighter(factor) if mode == 'lighter' else color.darker(factor)).name()
+
+
+# Filled in with %-substitution; literal braces need no escaping
+_GIF_BUTTON_QSS = """
+    QPushButton {
+        background-color: %(base)s;
+        color: #ffffff;
+        border: none;
+        border-radius: 8px;
+        padding: 12px 25px;
+        margin: 5px;
+    }
+    QPushButton:hover {
+        background-color: %(hover)s;
+    }
+    QPushButton:pressed {
+        background-color: %(pressed)s;
+        padding-top: 14px;
+        padding-bottom: 10px;
+    }
+    QPushButton:disabled {
+        background-color: #bdc3c7;
+        color: #7f8c8d;
+    }
+"""
+
+_CONTROL_BUTTON_QSS = """
+    QPushButton {
+        background-color: %(base)s;
+        color: white;
+        border: none;
+        border-radius: 10px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: %(hover)s; 
+    }
+    QPushButton:pressed {
+        background-color: %(pressed)s;
+    }
+"""
+
 # --- Custom Circular Progress Widget ---
 
 class CircularProgressBar(QWidget):
     """A custom widget to display progress in a circular gauge."""
+    _CACHE_LIMIT = 32  # Rendered frames kept per gauge (titles can change at runtime)
+
     def __init__(self, title, start_color="#3498db", end_color="#2ecc71", parent=None):
         super().__init__(parent)
         self.value = 0
@@ -599,20 +934,65 @@ class CircularProgressBar(QWidget):
         self.end_color = end_color
         self.setMinimumSize(QSize(150, 150))
         self.setMaximumSize(QSize(250, 250)) 
+        
+        # Rendered gauges keyed by (percent, title, width, pixel ratio); unchanged frames are just blitted
+        self._cache = {}
+        self._update_geometry()
 
     def setValue(self, value):
         """Sets the current percentage value (0-100)."""
         if 0 <= value <= 100:
-            self.value = value
+            value = int(value)
+            if value != self.value:
+                self.value = value
+                self.update()
+
+    def setTitle(self, title):
+        """Sets the caption under the value, repainting only if it changed."""
+        if title != self.title:
+            self.title = title
             self.update()
 
+    def resizeEvent(self, event):
+        self._update_geometry()
+        super().resizeEvent(event)
+
+    def _update_geometry(self):
+        """Recomputes size-dependent drawing state and drops stale cached frames."""
+        self._cache.clear()
+        
+        self._rect_f = self.rect().toRectF().adjusted(10, 10, -10, -10)
+        self._radius = min(self._rect_f.width(), self._rect_f.height()) / 2.0
+        self._font_value = QFont("Inter", int(self._radius * 0.45), QFont.Weight.Bold)
+        self._font_title = QFont("Inter", int(self._radius * 0.15), QFont.Weight.DemiBold)
+
     def paintEvent(self, event):
+        # The pixmap is rendered at the screen's pixel ratio, which changes when
+        # the window moves to a monitor with a different scale factor
+        key = (int(self.value), self.title, self.width(), self.devicePixelRatioF())
+        pixmap = self._cache.get(key)
+        if pixmap is None:
+            pixmap = self._render_gauge()
+            if len(self._cache) >= self._CACHE_LIMIT:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = pixmap
+        
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+
+    def _render_gauge(self):
+        """Renders the full gauge for the current value into a transparent pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        rect_f = self.rect().toRectF().adjusted(10, 10, -10, -10)
+        rect_f = self._rect_f
         center_f = rect_f.center() 
-        radius = min(rect_f.width(), rect_f.height()) / 2.0
+        radius = self._radius
         
         # Draw the Background Track
         track_pen = QPen(QColor("#34495e"), 10)
@@ -632,24 +1012,82 @@ class CircularProgressBar(QWidget):
         painter.setPen(progress_pen)
         
         start_angle = 90 * 16
-        span_angle = int(-self.value * 3.6 * 16)
+        span_angle = int(-int(self.value) * 3.6 * 16)
         
         painter.drawArc(rect_f, start_angle, span_angle)
 
         # Draw Text in Center
         painter.setPen(QPen(QColor("#ecf0f1")))
         
-        font_value = QFont("Inter", int(radius * 0.45), QFont.Weight.Bold)
-        painter.setFont(font_value)
+        painter.setFont(self._font_value)
         value_text = f"{int(self.value)}%"
         painter.drawText(rect_f, Qt.AlignmentFlag.AlignCenter, value_text)
         
-        font_title = QFont("Inter", int(radius * 0.15), QFont.Weight.DemiBold)
-        painter.setFont(font_title)
+        painter.setFont(self._font_title)
         
         title_rect = QRectF(rect_f)
         title_rect.moveBottom(rect_f.bottom() + radius * 0.4) 
         painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, self.title)
+        
+        painter.end()
+        return pixmap
+
+
+# Everything fed to the GIF players is GIF data, so the image format is never auto-detected
+GIF_FORMAT = b"gif"
+
+# Decoded frames are kept in memory (QMovie CacheAll, or the full-screen
+# pre-decode) only while frames x width x height x 4 bytes stays under this;
+# a 300-frame GIF at 4 MB per decoded frame would otherwise hold 1.2 GB.
+GIF_FRAME_CACHE_LIMIT = 16 * 1024 * 1024
+
+
+def _gif_reader(device):
+    """QImageReader for GIF data on device; the format is fixed so no plugin sniffing happens."""
+    reader = QImageReader(device, GIF_FORMAT)
+    reader.setAutoDetectImageFormat(False)
+    return reader
+
+
+def _read_gif_info(device):
+    """Returns (frame size, frame count) for the GIF on device without decoding it."""
+    pos = device.pos()
+    reader = _gif_reader(device)
+    size = reader.size()
+    frame_count = max(reader.imageCount(), 1)
+    device.seek(pos)
+    return size, frame_count
+
+
+def _gif_decoded_bytes(frame_size, frame_count):
+    """Memory needed to hold frame_count decoded ARGB32 frames of frame_size."""
+    return frame_count * frame_size.width() * frame_size.height() * 4
+
+
+class GifPreloadWorker(QThread):
+    """Decodes every frame of a GIF into QImages off the GUI thread."""
+    frames_ready = pyqtSignal(list, list)  # QImage frames, per-frame delays in ms
+
+    DEFAULT_FRAME_DELAY = 100  # ms, used when a frame does not specify its delay
+
+    def __init__(self, gif_data: QByteArray, parent=None):
+        super().__init__(parent)
+        self.gif_data = gif_data
+
+    def run(self):
+        frames, delays = [], []
+        buffer = QBuffer(self.gif_data)
+        if buffer.open(QIODevice.OpenModeFlag.ReadOnly):
+            reader = _gif_reader(buffer)
+            while reader.canRead() and not self.isInterruptionRequested():
+                image = reader.read()
+                if image.isNull():
+                    break
+                frames.append(image)
+                delay = reader.nextImageDelay()
+                delays.append(delay if delay > 0 else self.DEFAULT_FRAME_DELAY)
+            buffer.close()
+        self.frames_ready.emit(frames, delays)
 
 
 class FullScreenGifDialog(QDialog):
@@ -657,11 +1095,14 @@ class FullScreenGifDialog(QDialog):
     def __init__(self, movie_data: QByteArray, parent=None):
         super().__init__(parent)
         
-        self.movie_data = QByteArray(movie_data)  # Make a copy
-        self.gif_buffer = None
+        # No copy needed: the buffer is only read here, and GifPage replaces
+        # (rather than mutates) its QByteArray when a new GIF arrives.
+        self.movie_data = movie_data
         
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        # A new dialog is opened each time, so free this one (and its frames) on close
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -671,23 +1112,40 @@ class FullScreenGifDialog(QDialog):
         self.gif_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.gif_label.setScaledContents(False)
         
-        # Create buffer and movie
-        self.gif_buffer = QBuffer(self.movie_data)
-        if not self.gif_buffer.open(QIODevice.OpenModeFlag.ReadOnly):
-            self.gif_label.setText("Error loading GIF data for full screen.")
-            self.layout.addWidget(self.gif_label)
-            return
-
-        self.movie = QMovie()
-        self.movie.setCacheMode(QMovie.CacheMode.CacheAll)
-        self.movie.setDevice(self.gif_buffer)
-        
-        # Remove speed setting - let it play at original speed
-        # self.movie.setSpeed(100)  # Remove this line
+        # Frames are decoded up front on a worker thread and then played back
+        # from a timer, so libgif never runs on the GUI thread during playback
+        self._frames = []
+        self._delays = []
+        self._frame_index = 0
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.timeout.connect(self._advance_frame)
         
-        self.gif_label.setMovie(self.movie)
+        self.gif_label.setText("Loading GIF...")
         self.layout.addWidget(self.gif_label)
         
+        self.movie = None
+        self.gif_buffer = None
+        self._preload_worker = None
+        
+        estimate_buffer = QBuffer(self.movie_data)
+        estimate_buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        if _gif_decoded_bytes(*_read_gif_info(estimate_buffer)) > GIF_FRAME_CACHE_LIMIT:
+            # Too big to hold every frame: decode on demand with an uncached QMovie
+            self.gif_buffer = estimate_buffer
+            self.movie = QMovie()
+            self.movie.setCacheMode(QMovie.CacheMode.CacheNone)
+            self.movie.setFormat(GIF_FORMAT)
+            self.movie.setDevice(self.gif_buffer)
+            self.gif_label.setMovie(self.movie)
+            self.movie.start()
+        else:
+            estimate_buffer.close()
+            self._preload_worker = GifPreloadWorker(self.movie_data)
+            self._preload_worker.frames_ready.connect(self._on_frames_ready)
+            QApplication.instance().aboutToQuit.connect(self._stop_preload)
+            self._preload_worker.start()
+        
         # Close button
         self.close_button = QPushButton("✕ Close (Esc)")
         self.close_button.setFont(QFont("Inter", 12))
@@ -710,8 +1168,28 @@ class FullScreenGifDialog(QDialog):
         btn_layout.addSpacing(20)
         self.layout.addLayout(btn_layout)
         
-        # Start movie only after everything is set up
-        QTimer.singleShot(100, self.movie.start)
+    def _on_frames_ready(self, frames, delays):
+        """Converts the decoded frames to pixmaps (GUI thread only) and starts playback."""
+        if not frames:
+            self.gif_label.setText("Error loading GIF data for full screen.")
+            return
+        
+        self._frames = [QPixmap.fromImage(frame) for frame in frames]
+        self._delays = delays
+        self._frame_index = 0
+        self.gif_label.setPixmap(self._frames[0])
+        if len(self._frames) > 1 and self.isVisible():
+            self._frame_timer.start(self._delays[0])
+    
+    def _advance_frame(self):
+        self._frame_index = (self._frame_index + 1) % len(self._frames)
+        self.gif_label.setPixmap(self._frames[self._frame_index])
+        self._frame_timer.start(self._delays[self._frame_index])
+    
+    def _stop_preload(self):
+        if self._preload_worker and self._preload_worker.isRunning():
+            self._preload_worker.requestInterruption()
+            self._preload_worker.wait()
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Escape:
@@ -719,10 +1197,17 @@ class FullScreenGifDialog(QDialog):
         super().keyPressEvent(event)
         
     def closeEvent(self, event):
+        self._frame_timer.stop()
+        if self._preload_worker:
+            self._stop_preload()
+            QApplication.instance().aboutToQuit.disconnect(self._stop_preload)
+            self._preload_worker = None
         if self.movie:
             self.movie.stop()
         if self.gif_buffer and self.gif_buffer.isOpen():
             self.gif_buffer.close()
+        self._frames = []
+        self.movie_data = None
         super().closeEvent(event)
 
 # --- Content Pages ---
@@ -760,41 +1245,101 @@ class BasePage(QWidget):
         separator.setStyleSheet(f"background-color: {color}; border: none;")
         return separator
 
-    def _create_info_label(self, text):
+    def _create_info_label(self, text, color="#ecf0f1", bold=False):
             # Check if 'text' is bytes, and decode it if necessary.
             if isinstance(text, bytes):
                 text = text.decode('utf-8')
                 
             label = QLabel(text)
+            # Values are refreshed on timers: plain text skips the rich-text
+            # parse and layout on every setText(), so colour and weight are
+            # fixed here through QSS instead of inline HTML
+            label.setTextFormat(Qt.TextFormat.PlainText)
             label.setFont(QFont("Inter", 12))
-            label.setStyleSheet("color: #ecf0f1;")
+            label.setStyleSheet(f"color: {color};" + (" font-weight: bold;" if bold else ""))
             return label
 
+# --- Shared Network Access ---
+
+_network_manager = None
+NETWORK_TRANSFER_TIMEOUT_MS = 30000  # No bytes received for this long aborts a request
+
+def get_network_manager():
+    """
+    Returns the process-wide QNetworkAccessManager, created on first use (needs
+    a QApplication). Sharing one manager reuses TCP/TLS (and HTTP/2) connections
+    and a disk cache across every GIF fetch.
+    """
+    global _network_manager
+    if _network_manager is None:
+        _network_manager = QNetworkAccessManager(QApplication.instance())
+        
+        cache = QNetworkDiskCache(_network_manager)
+        cache.setCacheDirectory(os.path.join(tempfile.gettempdir(), 'pchmi_gif_cache'))
+        cache.setMaximumCacheSize(64 * 1024 * 1024)
+        _network_manager.setCache(cache)
+        
+        # Abort transfers that stall instead of leaving the page waiting forever
+        _network_manager.setTransferTimeout(NETWORK_TRANSFER_TIMEOUT_MS)
+    return _network_manager
+
+
 class GifPage(BasePage):
     """A content page to display a random GIF."""
     
-    def __init__(self, parent=None):
+    # One stylesheet for every label state; switching state only re-polishes
+    _GIF_LABEL_QSS = """
+        QLabel[state="idle"] { color: #7f8c8d; border: 2px dashed #34495e; padding: 20px; min-height: 400px; }
+        QLabel[state="loading"] { color: #f39c12; border: 2px dashed #34495e; padding: 20px; min-height: 400px; }
+        QLabel[state="error"] { color: #e74c3c; border: 2px dashed #c0392b; padding: 20px; min-height: 400px; }
+        QLabel[state="playing"] { border: none; }
+    """
+    
+    _BASE_URL = "https://api.giphy.com/v1/gifs/random"
+    _TAGS = "computer,tech,cat,funny"
+    _RATING = "g"
+    
+    def __init__(self, giphy_api_key="YOUR_API_KEY", parent=None, network_manager=None):
         super().__init__("Random GIF Viewer")
         self.parent = parent
         
         # Use the API key passed from settings
         self.GIPHY_API_KEY = giphy_api_key
-        self.GIPHY_RANDOM_URL = f"https://api.giphy.com/v1/gifs/random?api_key={self.GIPHY_API_KEY}&tag=computer,tech,cat,funny&rating=g"
         
+        # The request URL is built (and URL-encoded) once and reused for every fetch
+        query = QUrlQuery()
+        query.addQueryItem("api_key", self.GIPHY_API_KEY)
+        query.addQueryItem("tag", self._TAGS)
+        query.addQueryItem("rating", self._RATING)
+        self.GIPHY_RANDOM_URL = QUrl(self._BASE_URL)
+        self.GIPHY_RANDOM_URL.setQuery(query)
         
-        self.manager = QNetworkAccessManager()
+        
+        # The manager is shared app-wide; PyQt drops this connection when the page is destroyed
+        self.manager = network_manager or get_network_manager()
         self.manager.finished.connect(self._handle_network_reply)
+        self._pending = {}  # Reply -> 'meta' or 'gif', for replies issued by this page
         
         self.current_gif_url = None
         self.current_gif_data = QByteArray()
         self.gif_buffer = None # Attribute to hold the QBuffer for the QMovie
+        self._download_buffer = None  # Receives GIF bytes as they arrive
+        self.movie = None
+        self._gif_frame_size = QSize()  # Native size of the current GIF
+        
+        # Resizes are debounced; the movie is rescaled once the size settles
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(100)
+        self._resize_timer.timeout.connect(self._rescale_gif)
         
         # --- UI Elements ---
         
         self.gif_label = QLabel("Click 'Load New GIF' to start.")
         self.gif_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.gif_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.gif_label.setStyleSheet("color: #7f8c8d; border: 2px dashed #34495e; padding: 20px; min-height: 400px;")
+        self.gif_label.setStyleSheet(self._GIF_LABEL_QSS)
+        self._set_gif_state("idle")
         self.gif_label.setFont(QFont("Inter", 18))
         
         # Controls
@@ -816,61 +1361,93 @@ class GifPage(BasePage):
         self.layout.addWidget(self.gif_label)
         self.layout.addStretch(1)
         
-        # Start loading a GIF immediately
-        self.load_random_gif()
+        # The first GIF is fetched when the page is first shown (see showEvent)
+        self._first_show = True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._first_show:
+            self._first_show = False
+            self.load_random_gif()
+        elif self.movie is None and not self.current_gif_data.isEmpty():
+            # Re-decode from the retained compressed bytes
+            self._display_gif()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._release_movie()
+
+    def _release_movie(self):
+        """Stops playback and drops the QMovie with its decoded frames; current_gif_data is kept."""
+        if self.movie is None:
+            return
+        self.movie.stop()
+        self.gif_label.clear()
+        self.movie = None
+        if self.gif_buffer and self.gif_buffer.isOpen():
+            self.gif_buffer.close()
+        self.gif_buffer = None
 
     def _create_button(self, text, icon_name, color):
         """Helper to create styled control buttons."""
         button = QPushButton(f"{ICON_MAP.get(icon_name, '')} {text}")
         button.setFont(QFont("Inter", 14, QFont.Weight.Bold))
-        button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: #ffffff;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 25px;
-                margin: 5px;
-            }}
-            QPushButton:hover {{
-                background-color: {QColor(color).lighter(120).name()};
-            }}
-            QPushButton:pressed {{
-                background-color: {QColor(color).darker(120).name()};
-                padding-top: 14px;
-                padding-bottom: 10px;
-            }}
-            QPushButton:disabled {{
-                background-color: #bdc3c7;
-                color: #7f8c8d;
-            }}
-        """)
+        button.setStyleSheet(_GIF_BUTTON_QSS % {
+            'base': color,
+            'hover': _shade(color, 120, 'lighter'),
+            'pressed': _shade(color, 120, 'darker'),
+        })
         return button
 
+    def _set_gif_state(self, state):
+        """Switches gif_label between the _GIF_LABEL_QSS states without reparsing the stylesheet."""
+        if self.gif_label.property("state") == state:
+            return
+        self.gif_label.setProperty("state", state)
+        style = self.gif_label.style()
+        style.unpolish(self.gif_label)
+        style.polish(self.gif_label)
+
     def load_random_gif(self):
         """Step 1: Fetch the URL of a random GIF from GIPHY."""
+        # Drop the previous GIF (movie, frames and bytes) up front so it is not
+        # held alongside the new one; an open full-screen dialog keeps its own
+        # implicitly shared reference
+        self._release_movie()
+        self.current_gif_data = QByteArray()
         self.gif_label.setText("Loading GIF metadata...")
-        self.gif_label.setStyleSheet("color: #f39c12; border: 2px dashed #34495e; padding: 20px; min-height: 400px;")
+        self._set_gif_state("loading")
         self.load_button.setEnabled(False)
         self.fullscreen_button.setEnabled(False)
         
-        request = QNetworkRequest(QUrl(self.GIPHY_RANDOM_URL))
-        self.manager.get(request)
+        request = QNetworkRequest(self.GIPHY_RANDOM_URL)
+        request.setAttribute(QNetworkRequest.Attribute.Http2AllowedAttribute, True)
+        # The "random" endpoint must never be answered from (or stored in) the disk cache
+        request.setAttribute(QNetworkRequest.Attribute.CacheLoadControlAttribute, QNetworkRequest.CacheLoadControl.AlwaysNetwork)
+        request.setAttribute(QNetworkRequest.Attribute.CacheSaveControlAttribute, False)
+        self._pending[self.manager.get(request)] = 'meta'
 
     def _handle_network_reply(self, reply: QNetworkReply):
         """Handles responses for both metadata and the raw GIF data."""
-        url = reply.url().toString()
+        # Dispatch on the reply object itself: the manager is shared (replies
+        # from other pages are ignored) and redirects change reply.url()
+        kind = self._pending.pop(reply, None)
+        if kind is None:
+            return
         
         if reply.error() != QNetworkReply.NetworkError.NoError:
             error_message = f"Network Error: {reply.errorString()}"
             self.gif_label.setText(f"Error loading GIF: {error_message}")
-            self.gif_label.setStyleSheet("color: #e74c3c; border: 2px dashed #c0392b; padding: 20px; min-height: 400px;")
+            self._set_gif_state("error")
             self.load_button.setEnabled(True)
+            if kind == 'gif':
+                self._download_buffer = None
+            reply.deleteLater()
             return
             
         data = reply.readAll()
         
-        if url.startswith("https://api.giphy.com"):
+        if kind == 'meta':
             # Step 1 response: Metadata
             try:
                 json_data = json.loads(bytes(data))
@@ -886,10 +1463,18 @@ class GifPage(BasePage):
                 self.gif_label.setText(f"Error parsing GIF metadata: {e}")
                 self.load_button.setEnabled(True)
                 
-        elif url == self.current_gif_url:
-            # Step 2 response: Raw GIF data
-            self.current_gif_data = data
+        elif kind == 'gif':
+            # Step 2 response: Raw GIF data. Most of it was already streamed into
+            # the download buffer by _on_gif_ready_read; data is whatever remains.
+            buffer, self._download_buffer = self._download_buffer, None
+            buffer.write(data)
+            # Shares the buffer's array (sized from Content-Length), no copy
+            self.current_gif_data = buffer.data()
+            buffer.close()
             self._display_gif()
+            if not self.isVisible():
+                # Finished while the page was hidden; showEvent decodes it again
+                self._release_movie()
 
         reply.deleteLater()
 
@@ -898,7 +1483,32 @@ class GifPage(BasePage):
         """Step 2: Download the raw GIF image using the URL."""
         self.gif_label.setText("Downloading GIF image...")
         request = QNetworkRequest(QUrl(url))
-        self.manager.get(request)
+        request.setAttribute(QNetworkRequest.Attribute.Http2AllowedAttribute, True)
+        # GIF files are immutable, so a previously fetched one can come straight from disk
+        request.setAttribute(QNetworkRequest.Attribute.CacheLoadControlAttribute, QNetworkRequest.CacheLoadControl.PreferCache)
+        # Follow the CDN's redirects, but never from HTTPS down to HTTP
+        request.setAttribute(QNetworkRequest.Attribute.RedirectPolicyAttribute, QNetworkRequest.RedirectPolicy.NoLessSafeRedirectPolicy)
+        
+        # Bytes are written into this buffer as they arrive, so the GIF is never
+        # accumulated in the reply and copied out of it at the end
+        self._download_buffer = QBuffer()
+        self._download_buffer.open(QIODevice.OpenModeFlag.ReadWrite)
+        
+        reply = self.manager.get(request)
+        reply.readyRead.connect(self._on_gif_ready_read)
+        self._pending[reply] = 'gif'
+    
+    def _on_gif_ready_read(self):
+        """Appends the newly received chunk of GIF data to the download buffer."""
+        reply = self.sender()
+        if self._download_buffer is not None and self._pending.get(reply) == 'gif':
+            if self._download_buffer.pos() == 0:
+                # Allocate the whole GIF up front when the server announces its
+                # size, instead of growing (and copying) the array chunk by chunk
+                length = reply.header(QNetworkRequest.KnownHeaders.ContentLengthHeader)
+                if length:
+                    self._download_buffer.buffer().reserve(int(length))
+            self._download_buffer.write(reply.readAll())
         
     def _display_gif(self):
         """Step 3: Load the raw data into QMovie and display it."""
@@ -917,30 +1527,32 @@ class GifPage(BasePage):
                 raise Exception("Failed to open GIF data buffer.")
 
             self.movie = QMovie()
-            self.movie.setCacheMode(QMovie.CacheMode.CacheAll)
-            self.movie.setDevice(self.gif_buffer) # Use setDevice instead of setData
             
-            # Try to get the size of the first frame immediately after setting device
-            first_frame_pixmap = self.movie.currentPixmap()
-            if not first_frame_pixmap.isNull():
-                frame_size = first_frame_pixmap.size()
-                
-                # Calculate aspect ratio to fit within 80% of current widget size
-                max_width = int(self.width() * 0.8) if self.width() > 0 else 600
-                max_height = int(self.height() * 0.8) if self.height() > 0 else 400
-                
-                scaled_size = frame_size.scaled(max_width, max_height, Qt.AspectRatioMode.KeepAspectRatio)
-                self.gif_label.setFixedSize(scaled_size)
+            # Frames are decoded straight at the display size (QMovie scales in
+            # its reader), so the label never rescales them on paint and the
+            # frame cache holds display-sized pixmaps
+            frame_size, frame_count = _read_gif_info(self.gif_buffer)
+            self._gif_frame_size = frame_size
+            if frame_size.isValid():
+                scaled_size = self._fit_gif_size(frame_size)
+                self._set_movie_size(scaled_size)
+                decoded_bytes = _gif_decoded_bytes(scaled_size, frame_count)
             else:
-                # FIX: Remove setting size to (-1, -1) which causes a warning.
-                # The stylesheet min-height will handle the initial size if frame is slow.
-                pass 
-
-            # The signal connection ensures dynamic resizing if the initial frame check fails
-            self.movie.frameChanged.connect(self._adjust_label_size)
+                # Size unknown until the first frame is decoded; the slot only
+                # needs to run once, so it must not stay connected at ~30 fps
+                self.movie.frameChanged.connect(self._adjust_label_size, Qt.ConnectionType.SingleShotConnection)
+                decoded_bytes = 0
+            
+            # Keep decoded frames only when they fit in GIF_FRAME_CACHE_LIMIT
+            if decoded_bytes > GIF_FRAME_CACHE_LIMIT:
+                self.movie.setCacheMode(QMovie.CacheMode.CacheNone)
+            else:
+                self.movie.setCacheMode(QMovie.CacheMode.CacheAll)
+            self.movie.setFormat(GIF_FORMAT)
+            self.movie.setDevice(self.gif_buffer) # Use setDevice instead of setData
             
             self.gif_label.setMovie(self.movie)
-            self.gif_label.setStyleSheet("border: none;")
+            self._set_gif_state("playing")
             self.movie.start()
             
             self.load_button.setEnabled(True)
@@ -951,23 +1563,46 @@ class GifPage(BasePage):
             self.load_button.setEnabled(True)
             self.fullscreen_button.setEnabled(False)
 
+    def _fit_gif_size(self, frame_size):
+        """
+        Shrinks frame_size to fit within 80% of the page, keeping its aspect
+        ratio. GIFs that already fit keep their native size.
+        """
+        max_width = int(self.width() * 0.8) if self.width() > 0 else 600
+        max_height = int(self.height() * 0.8) if self.height() > 0 else 400
+        if frame_size.width() <= max_width and frame_size.height() <= max_height:
+            return frame_size
+        return frame_size.scaled(max_width, max_height, Qt.AspectRatioMode.KeepAspectRatio)
+
+    def _set_movie_size(self, scaled_size):
+        """Scales the movie's frames to scaled_size, or decodes them unscaled at the native size."""
+        self.movie.setScaledSize(QSize() if scaled_size == self._gif_frame_size else scaled_size)
+
     def _adjust_label_size(self):
-        """Adjusts the label size to fit the first frame of the GIF and then disconnects."""
-        if self.movie.currentFrameNumber() == 0:
-            frame_size = self.movie.currentPixmap().size()
-            
-            # Calculate aspect ratio to fit within 80% of current widget size
-            max_width = int(self.width() * 0.8) if self.width() > 0 else 600
-            max_height = int(self.height() * 0.8) if self.height() > 0 else 400
-            
-            scaled_size = frame_size.scaled(max_width, max_height, Qt.AspectRatioMode.KeepAspectRatio)
-            self.gif_label.setFixedSize(scaled_size)
-            
-            # Disconnect the signal after first frame is processed
-            try:
-                self.movie.frameChanged.disconnect(self._adjust_label_size)
-            except TypeError:
-                pass # Already disconnected
+        """Scales the movie to fit once the first frame reveals its size (runs once per GIF)."""
+        # frameRect() is already known from the decode that fired frameChanged;
+        # currentPixmap() would allocate a copy of the frame just to read its size
+        self._gif_frame_size = self.movie.frameRect().size()
+        self._set_movie_size(self._fit_gif_size(self._gif_frame_size))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.movie:
+            self._resize_timer.start()
+
+    def _rescale_gif(self):
+        """Refits the playing GIF to the page after a resize."""
+        if not self.movie or not self._gif_frame_size.isValid():
+            return
+        scaled_size = self._fit_gif_size(self._gif_frame_size)
+        current_size = self.movie.scaledSize() if self.movie.scaledSize().isValid() else self._gif_frame_size
+        if scaled_size == current_size:
+            return
+        if self.movie.cacheMode() == QMovie.CacheMode.CacheAll:
+            # Already-cached frames keep their old size, so restart the movie
+            self._display_gif()
+        else:
+            self._set_movie_size(scaled_size)
                 
     def show_fullscreen(self):
         """Opens the GIF in a full-screen, frameless dialog."""
@@ -975,67 +1610,141 @@ class GifPage(BasePage):
             QMessageBox.warning(self, "Warning", "Please wait for the GIF to load before enabling full screen.")
             return
 
-        dialog = FullScreenGifDialog(self.current_gif_data, parent=self.window())
-        
-        # Get the screen where the main window is displayed
-        main_window = self.window()
-        screen = QApplication.screenAt(main_window.geometry().center())
-        
-        if not screen:
-            screen = QApplication.primaryScreen()
-        
-        if screen:
-            screen_geometry = screen.geometry()
-            dialog.setGeometry(screen_geometry)
-        
-        dialog.showFullScreen()
-        
+        dialog = FullScreenGifDialog(self.current_gif_data, parent=self.window())
+        
+        # Get the screen where the main window is displayed
+        main_window = self.window()
+        screen = QApplication.screenAt(main_window.geometry().center())
+        
+        if not screen:
+            screen = QApplication.primaryScreen()
+        
+        if screen:
+            screen_geometry = screen.geometry()
+            dialog.setGeometry(screen_geometry)
+        
+        dialog.showFullScreen()
+        
+
+# --- Static System Information ---
+
+# Boot time never changes while the app runs, so it is read and formatted once
+try:
+    _BOOT_TIMESTAMP = psutil.boot_time()
+    _BOOT_TIME_STR = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(_BOOT_TIMESTAMP))
+except Exception:
+    _BOOT_TIMESTAMP = None
+    _BOOT_TIME_STR = "N/A"
+
+
+def _uptime_parts():
+    """Returns the system uptime as (days, hours, minutes), or None if the boot time is unknown."""
+    if _BOOT_TIMESTAMP is None:
+        return None
+    days, rem = divmod(int(time.time() - _BOOT_TIMESTAMP), 86400)
+    hours, rem = divmod(rem, 3600)
+    return days, hours, rem // 60
+
+
+@functools.lru_cache(maxsize=None)
+def _compute_static_system_info():
+    """
+    Probes the system details that never change while the app runs (cpuinfo
+    execs a subprocess, WMI has a slow COM cold start). Called through
+    _static_system_info(), which serializes access.
+    """
+    info = {}
+    
+    try:
+        info['general'] = {
+            "OS Platform": f"{SYSTEM} {platform.release()}",
+            "Architecture": platform.architecture()[0],
+            "Total RAM": f"{psutil.virtual_memory().total / _GIB:.1f} GB",
+        }
+    except Exception:
+        info['general'] = {"OS Platform": "N/A", "Architecture": "N/A", "Total RAM": "N/A"}
+    
+    try:
+        cpuinfo = _load_cpuinfo()
+        info['cpu'] = {
+            "Processor Model": cpuinfo.get_cpu_info().get('brand_raw', 'Unknown/Generic') if cpuinfo else platform.processor(),
+            "Physical Cores": str(psutil.cpu_count(logical=False)),
+            "Logical Threads": str(psutil.cpu_count(logical=True)),
+            "Base Freq.": f"{psutil.cpu_freq().max / 1000:.2f} GHz",
+        }
+    except Exception as e:
+        print(f"Error fetching detailed CPU info: {e}")
+        info['cpu'] = {"Processor Model": "N/A", "Physical Cores": "N/A", "Logical Threads": "N/A", "Base Freq.": "N/A"}
+    
+    # BIOS & Firmware
+    wmi = _load_wmi() if SYSTEM == 'Windows' else None
+    if wmi:
+        # COM must be initialized on every thread that uses WMI
+        pythoncom = _lazy_import('pythoncom')
+        com_initialized = False
+        if pythoncom and threading.current_thread() is not threading.main_thread():
+            pythoncom.CoInitialize()
+            com_initialized = True
+        try:
+            # find_classes=False skips enumerating the whole WMI class index;
+            # WQL fetches only the properties shown, one query per class
+            c = wmi.WMI(find_classes=False)
+            bios = c.query("SELECT Manufacturer, SMBIOSBIOSVersion, ReleaseDate FROM Win32_BIOS")[0]
+            computer = c.query("SELECT Manufacturer FROM Win32_ComputerSystem")[0]
+            
+            info['bios'] = {
+                "BIOS Vendor": bios.Manufacturer,
+                "BIOS Version": bios.SMBIOSBIOSVersion,
+                "Release Date": bios.ReleaseDate.split('.')[0],
+                "System Manufacturer": computer.Manufacturer,
+            }
+        except Exception as e:
+            print(f"Error fetching BIOS info with WMI: {e}")
+            info['bios'] = {"BIOS Vendor": "N/A", "BIOS Version": "N/A", "Release Date": "N/A", "System Manufacturer": "N/A"}
+        finally:
+            if com_initialized:
+                pythoncom.CoUninitialize()
+    else:
+        info['bios'] = {"BIOS Vendor": "N/A (WMI/Platform not available)", "BIOS Version": "N/A", "Release Date": "N/A", "System Manufacturer": "N/A"}
+    
+    return info
+
+
+_static_info_lock = threading.Lock()
+
+
+def _static_system_info():
+    """
+    Returns the cached static system info. Safe to call from any thread; a
+    caller arriving while the probe runs waits for it instead of probing again.
+    """
+    with _static_info_lock:
+        return _compute_static_system_info()
+
 
 class SystemInfoPage(BasePage):
     """Displays static system information with universal GPU detection."""
     def __init__(self):
         super().__init__("System Information")
         
+        # Usually already warm: startup runs the probe on the thread pool
+        static_info = _static_system_info()
+        
         # General System Status
-        try:
-            total_ram = round(psutil.virtual_memory().total / (1024**3), 1)
-            boot_timestamp = psutil.boot_time()
-            uptime_seconds = time.time() - boot_timestamp
-            
-            days = int(uptime_seconds // (24 * 3600))
-            hours = int((uptime_seconds % (24 * 3600)) // 3600)
-            uptime_str = f"{days} days, {hours} hours"
-            boot_time_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(boot_timestamp))
-
-            general_info = {
-                "OS Platform": f"{platform.system()} {platform.release()}",
-                "Architecture": platform.architecture()[0],
-                "Total RAM": f"{total_ram} GB",
-                "System Uptime": uptime_str,
-                "Boot Time": boot_time_str
-            }
-        except Exception:
-             general_info = {"OS Platform": "N/A", "Architecture": "N/A", "Total RAM": "N/A", "System Uptime": "N/A", "Boot Time": "N/A"}
+        general_info = dict(static_info['general'])
+        uptime = _uptime_parts()
+        general_info["System Uptime"] = f"{uptime[0]} days, {uptime[1]} hours" if uptime else "N/A"
+        general_info["Boot Time"] = _BOOT_TIME_STR
         
         self._add_info_block("General System Status (Real)", general_info, color="#2ecc71")
         
         # CPU Details
+        cpu_info = dict(static_info['cpu'])
         try:
-            processor_model = cpuinfo.get_cpu_info().get('brand_raw', 'Unknown/Generic') if cpuinfo else platform.processor()
-
             current_freq = psutil.cpu_freq().current
-            current_freq_str = f"{current_freq / 1000:.2f} GHz" if current_freq else "N/A"
-
-            cpu_info = {
-                "Processor Model": processor_model,
-                "Physical Cores": str(psutil.cpu_count(logical=False)),
-                "Logical Threads": str(psutil.cpu_count(logical=True)),
-                "Base Freq.": f"{psutil.cpu_freq().max / 1000:.2f} GHz",
-                "Current Freq.": current_freq_str,
-            }
-        except Exception as e:
-            print(f"Error fetching detailed CPU info: {e}")
-            cpu_info = {"Processor Model": "N/A", "Physical Cores": "N/A", "Logical Threads": "N/A", "Base Freq.": "N/A", "Current Freq.": "N/A"}
+            cpu_info["Current Freq."] = f"{current_freq / 1000:.2f} GHz" if current_freq else "N/A"
+        except Exception:
+            cpu_info["Current Freq."] = "N/A"
         
         self._add_info_block("CPU (Central Processing Unit) Details (Real)", cpu_info, color="#f1c40f")
 
@@ -1051,23 +1760,7 @@ class SystemInfoPage(BasePage):
         self._add_info_block("GPU (Graphics Processing Unit) Details (Universal Detection)", gpu_info, color="#e74c3c")
         
         # BIOS & Firmware
-        bios_info = {}
-        if wmi and platform.system() == 'Windows':
-            try:
-                c = wmi.WMI()
-                bios = c.Win32_BIOS()[0]
-                
-                bios_info = {
-                    "BIOS Vendor": bios.Manufacturer,
-                    "BIOS Version": bios.SMBIOSBIOSVersion,
-                    "Release Date": bios.ReleaseDate.split('.')[0],
-                    "System Manufacturer": c.Win32_ComputerSystem()[0].Manufacturer,
-                }
-            except Exception as e:
-                print(f"Error fetching BIOS info with WMI: {e}")
-                bios_info = {"BIOS Vendor": "N/A", "BIOS Version": "N/A", "Release Date": "N/A", "System Manufacturer": "N/A"}
-        else:
-            bios_info = {"BIOS Vendor": "N/A (WMI/Platform not available)", "BIOS Version": "N/A", "Release Date": "N/A", "System Manufacturer": "N/A"}
+        bios_info = static_info['bios']
 
         self._add_info_block("BIOS & Firmware", bios_info, color="#3498db")
         
@@ -1097,26 +1790,399 @@ class SystemInfoPage(BasePage):
         self.layout.addSpacing(20)
 
 
+class StatsWorker(QThread):
+    """Calls the sample callable on a background thread at a fixed interval and emits each dict it returns."""
+    stats_ready = pyqtSignal(dict)
+
+    def __init__(self, sample, interval_ms, parent=None):
+        super().__init__(parent)
+        self._sample = sample
+        self.interval_ns = interval_ms * 1_000_000
+        self._stopping = False
+        self._wake_event = threading.Event()
+
+    def start(self, *args):
+        if self.isRunning():
+            if not self._stopping:
+                return  # Already polling
+            # A loop asked to stop may still be finishing its last sample
+            self.wait()
+        self._stopping = False
+        self._wake_event.clear()
+        super().start(*args)
+
+    def request_stop(self):
+        """Wakes the polling loop and lets it exit without waiting for it."""
+        self._stopping = True
+        self._wake_event.set()
+
+    def stop(self):
+        """Wakes the polling loop and waits for the thread to finish."""
+        self.request_stop()
+        self.wait()
+
+    def sample_now(self):
+        """Wakes the polling loop for an immediate sample; the schedule restarts from it."""
+        self._wake_event.set()
+
+    def run(self):
+        next_tick = time.monotonic_ns()
+        while not self._stopping:
+            try:
+                self.stats_ready.emit(self._sample())
+            except Exception as e:
+                print(f"Error in {type(self).__name__}: {e}")
+
+            # Deadlines advance from the previous one rather than from "now", so
+            # the time spent polling does not accumulate as drift. Ticks missed
+            # during a stall are skipped instead of being fired back to back.
+            next_tick += self.interval_ns
+            now = time.monotonic_ns()
+            if next_tick <= now:
+                next_tick += ((now - next_tick) // self.interval_ns + 1) * self.interval_ns
+            if self._wake_event.wait((next_tick - now) / 1e9):
+                self._wake_event.clear()
+                next_tick = time.monotonic_ns()
+
+
+def _disk_used_percent(mountpoint):
+    """
+    Percentage of mountpoint's space in use, from a single statvfs() or
+    GetDiskFreeSpaceExW() call (same formula as psutil.disk_usage().percent).
+    """
+    if os.name == 'nt':
+        free_to_caller = ctypes.c_ulonglong()
+        total = ctypes.c_ulonglong()
+        total_free = ctypes.c_ulonglong()
+        if not ctypes.windll.kernel32.GetDiskFreeSpaceExW(
+                ctypes.c_wchar_p(mountpoint), ctypes.byref(free_to_caller),
+                ctypes.byref(total), ctypes.byref(total_free)):
+            raise ctypes.WinError()
+        return (total.value - total_free.value) * 100 / total.value if total.value else 0.0
+    
+    st = os.statvfs(mountpoint)
+    used = st.f_blocks - st.f_bfree
+    # Space reserved for root is not available to the user, as in psutil
+    total_user = used + st.f_bavail
+    return used * 100 / total_user if total_user else 0.0
+
+
+class SystemStatsWorker(StatsWorker):
+    """Samples CPU, memory, disk I/O and disk usage with psutil off the GUI thread."""
+
+    GAUGE_FUNCS = {
+        # Non-blocking: the usage since the previous call, so the sampling
+        # interval itself is the measurement window
+        "CPU": lambda: psutil.cpu_percent(interval=None),
+        "Memory": lambda: psutil.virtual_memory().percent,
+        "Net": lambda: random.uniform(25, 75),
+    }
+
+    # Free space changes slowly, so disk usage is re-read only every N samples (~6 s)
+    DISK_USAGE_EVERY = 4
+
+    def __init__(self, mountpoints, interval_ms=1500, parent=None):
+        super().__init__(self.sample, interval_ms, parent)
+        self.mountpoints = tuple(mountpoints)
+        self.last_io_counters = psutil.disk_io_counters()
+        self.last_update_time = time.time()
+        self._tick = 0
+        self._disk_usage_cache = {}  # mountpoint -> (tick bucket, percent or None)
+        # Prime the CPU counters; the first sample after this covers a very
+        # short window and may read 0.0
+        psutil.cpu_percent(interval=None)
+
+    def sample(self):
+        stats = {}
+        
+        for key, func in self.GAUGE_FUNCS.items():
+            try:
+                stats[key] = func()
+            except Exception:
+                stats[key] = 0
+
+        try:
+            freq = psutil.cpu_freq()
+            stats['cpu_freq'] = (freq.current, freq.max)
+        except Exception:
+            stats['cpu_freq'] = None
+
+        # Disk throughput in MB/s since the previous sample (None on the first one)
+        stats['disk_rates'] = None
+        current_io_counters = psutil.disk_io_counters()
+        current_time = time.time()
+        time_delta = current_time - self.last_update_time
+        
+        if self.last_io_counters and current_io_counters and time_delta > 0:
+            read_rate_bytes = (current_io_counters.read_bytes - self.last_io_counters.read_bytes) / time_delta
+            write_rate_bytes = (current_io_counters.write_bytes - self.last_io_counters.write_bytes) / time_delta
+            stats['disk_rates'] = (read_rate_bytes / (1024 * 1024), write_rate_bytes / (1024 * 1024))
+
+        self.last_io_counters = current_io_counters
+        self.last_update_time = current_time
+
+        bucket = self._tick // self.DISK_USAGE_EVERY
+        self._tick += 1
+        disk_usage = {}
+        for mountpoint in self.mountpoints:
+            cached = self._disk_usage_cache.get(mountpoint)
+            if cached is None or cached[0] != bucket:
+                try:
+                    percent = round(_disk_used_percent(mountpoint), 1)
+                except Exception:
+                    percent = None
+                cached = self._disk_usage_cache[mountpoint] = (bucket, percent)
+            disk_usage[mountpoint] = cached[1]
+        stats['disk_usage'] = disk_usage
+        
+        return stats
+
+
+class GpuStatsWorker(StatsWorker):
+    """Polls the GPU detector on a background thread and emits each sample."""
+
+    def __init__(self, detector, interval_ms=2000, parent=None):
+        super().__init__(self.sample, interval_ms, parent)
+        self.detector = detector
+
+    def sample(self):
+        # Emit a copy so the GUI thread never shares the detector's dict
+        return dict(self.detector.get_live_stats())
+
+
+# One process table row; a tuple is far smaller than a dict and unpacks quickly in data()
+ProcRow = collections.namedtuple("ProcRow", "pid name cpu memory status")
+
+# Linux fast path: everything a row needs is in /proc/<pid>/stat, so one file
+# read per process replaces psutil's Process objects and its several reads
+_PROC_STAT_FAST_PATH = SYSTEM == 'Linux' and os.path.isdir('/proc')
+if _PROC_STAT_FAST_PATH:
+    _CLK_TCK = os.sysconf('SC_CLK_TCK')
+    _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+_PROC_COMM_LEN = 15  # TASK_COMM_LEN - 1: longest name /proc/<pid>/stat reports
+
+# /proc/<pid>/stat state letters, named like psutil's STATUS_* constants
+_PROC_STATES = {
+    'R': 'running', 'S': 'sleeping', 'D': 'disk-sleep', 'T': 'stopped', 't': 'tracing-stop',
+    'Z': 'zombie', 'X': 'dead', 'x': 'dead', 'K': 'wake-kill', 'W': 'waking', 'P': 'parked', 'I': 'idle',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _username_for_uid(uid):
+    """User name for a uid (passwd lookups are cached; the uid itself if it has no entry)."""
+    pwd = _lazy_import('pwd')
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except (AttributeError, KeyError):
+        return str(uid)
+
+
+def _full_process_name(pid, comm):
+    """
+    The kernel truncates /proc/<pid>/stat names to 15 characters; like
+    psutil, recover the full name from the executable in /proc/<pid>/cmdline
+    when it starts with the truncated one.
+    """
+    try:
+        with open(f"/proc/{pid}/cmdline", 'rb') as f:
+            argv0 = f.read().split(b'\0', 1)[0]
+    except OSError:
+        return comm
+    extended = os.path.basename(argv0.decode('utf-8', 'replace'))
+    return extended if extended.startswith(comm) else comm
+
+
+class ProcessScanner(StatsWorker):
+    """Enumerates processes on a background thread and emits the rows for the current filter."""
+
+    PROCESS_ATTRS = ('pid', 'name', 'memory_percent', 'status')
+    MAX_ROWS = 50  # Limit to top 50 for performance
+    # cpu_percent() is the costliest attribute (CPU times per process) and an
+    # average over a longer window is steadier, so it is re-read every Nth scan
+    CPU_SAMPLE_EVERY = 3
+
+    # C-level key functions: no Python frame per comparison, unlike a lambda
+    _SORT_BY_CPU = operator.itemgetter(ProcRow._fields.index('cpu'))
+    _SORT_BY_MEMORY = operator.itemgetter(ProcRow._fields.index('memory'))
+
+    def __init__(self, interval_ms=5000, parent=None):
+        super().__init__(self.sample, interval_ms, parent)
+        # Set from the GUI thread; each scan reads it once
+        self.filter_type = "all"
+        # psutil.Process handles kept across scans so cpu_percent() measures
+        # the delta since the previous scan instead of reporting 0.0
+        self._proc_cache = {}
+        self._cpu_cache = {}  # pid -> cpu_percent from the last CPU scan
+        self._tick = 0
+        # /proc fast path: CPU ticks per (pid, start time) and the time of the previous scan
+        self._cpu_ticks = {}
+        self._cpu_ticks_time = None
+        self._total_ram = psutil.virtual_memory().total
+
+    def get_process(self, pid):
+        """
+        Returns the cached psutil.Process for pid, or a new handle if no scan has
+        cached it (the /proc fast path never does). psutil guards kill()/nice()
+        on a handle against the PID being reused only after the handle was
+        created, so a new handle cannot tell a process that exited since the
+        last scan from a new one with the same PID.
+        """
+        proc = self._proc_cache.get(pid)
+        return proc if proc is not None else psutil.Process(pid)
+
+    def sample(self):
+        filter_type = self.filter_type
+        try:
+            processes = self._scan(filter_type)
+        except Exception as e:
+            return {'filter': filter_type, 'processes': None, 'error': str(e)}
+        return {'filter': filter_type, 'processes': processes, 'error': None}
+
+    def _scan(self, filter_type):
+        if _PROC_STAT_FAST_PATH:
+            processes = self._scan_proc_stat(filter_type)
+        else:
+            processes = self._scan_psutil(filter_type)
+        
+        # Top 50 by memory usage (CPU for the cpu filter), descending; a bounded
+        # heap instead of sorting every process only to keep the first 50
+        sort_key = self._SORT_BY_CPU if filter_type == "cpu" else self._SORT_BY_MEMORY
+        return heapq.nlargest(self.MAX_ROWS, processes, key=sort_key)
+
+    @staticmethod
+    def _passes_filter(filter_type, cpu, memory, username=None):
+        """Applies the page's process filter to one process."""
+        if filter_type == "user":
+            # Try to filter out system processes
+            if SYSTEM == 'Windows':
+                return not (username and 'SYSTEM' in username.upper())
+            return username not in ['root', 'daemon', 'sys']
+        if filter_type == "cpu":
+            return cpu >= 5.0  # Show only >5% CPU
+        if filter_type == "memory":
+            return memory >= 1.0  # Show only >1% Memory
+        return True
+
+    def _scan_proc_stat(self, filter_type):
+        """
+        Builds the rows from /proc/<pid>/stat alone (plus a stat() of the
+        directory for the owner when the user filter needs it). The CPU ticks
+        come with the same read, so CPU usage is measured on every scan.
+        """
+        processes = []
+        
+        now = time.monotonic()
+        elapsed = now - self._cpu_ticks_time if self._cpu_ticks_time is not None else 0
+        self._cpu_ticks_time = now
+        previous_ticks, cpu_ticks = self._cpu_ticks, {}
+        # Same definitions as psutil: % of one CPU over the interval, RSS % of RAM
+        cpu_scale = 100 / (_CLK_TCK * elapsed) if elapsed else 0
+        memory_scale = 100 * _PAGE_SIZE / self._total_ram
+        
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f"/proc/{entry.name}/stat", 'rb') as f:
+                        stat = f.read()
+                    username = _username_for_uid(entry.stat().st_uid) if filter_type == "user" else None
+                except OSError:
+                    continue  # Exited since the directory was listed
+                
+                # The name may itself contain spaces and ')', so split at the last ')';
+                # fields[n - 3] is field n of proc(5)
+                name_end = stat.rfind(b')')
+                name = stat[stat.find(b'(') + 1:name_end].decode('utf-8', 'replace')
+                fields = stat[name_end + 2:].split()
+                pid = int(entry.name)
+                ticks = int(fields[11]) + int(fields[12])  # utime + stime
+                # With the start time in the key, a PID reused since the last
+                # scan starts a new delta instead of going negative
+                key = (pid, fields[19])
+                cpu_ticks[key] = ticks
+                
+                previous = previous_ticks.get(key)
+                cpu = (ticks - previous) * cpu_scale if previous is not None else 0.0
+                memory = int(fields[21]) * memory_scale  # rss, in pages
+                
+                if not self._passes_filter(filter_type, cpu, memory, username):
+                    continue
+                if len(name) == _PROC_COMM_LEN:
+                    name = _full_process_name(pid, name)
+                processes.append(ProcRow(pid, name, cpu, memory, _PROC_STATES.get(fields[0].decode(), '?')))
+        
+        self._cpu_ticks = cpu_ticks
+        return processes
+
+    def _scan_psutil(self, filter_type):
+        processes = []
+        
+        # as_dict() already reads all attributes inside one oneshot() block;
+        # username (uid lookup plus a passwd/SID query) is only needed by the user filter
+        attrs = self.PROCESS_ATTRS + ('username',) if filter_type == "user" else self.PROCESS_ATTRS
+        cpu_attrs = attrs + ('cpu_percent',)
+        sample_cpu = self._tick % self.CPU_SAMPLE_EVERY == 0
+        self._tick += 1
+        
+        pids = psutil.pids()
+        
+        # Drop handles for processes that have exited
+        for pid in self._proc_cache.keys() - set(pids):
+            del self._proc_cache[pid]
+            self._cpu_cache.pop(pid, None)
+        
+        for pid in pids:
+            try:
+                proc = self._proc_cache.get(pid)
+                if proc is None:
+                    proc = psutil.Process(pid)
+                    self._proc_cache[pid] = proc
+                    # A new handle always reads cpu_percent once so the next CPU
+                    # scan measures from here instead of reporting 0.0 again
+                    info = proc.as_dict(attrs=cpu_attrs, ad_value=None)
+                else:
+                    info = proc.as_dict(attrs=cpu_attrs if sample_cpu else attrs, ad_value=None)
+                
+                if 'cpu_percent' in info:
+                    self._cpu_cache[pid] = info['cpu_percent'] or 0
+                cpu = self._cpu_cache.get(pid, 0)
+                memory = info['memory_percent'] or 0
+                
+                if not self._passes_filter(filter_type, cpu, memory, info.get('username')):
+                    continue
+                processes.append(ProcRow(info['pid'], info['name'], cpu, memory, info['status']))
+            
+            except (psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+            except psutil.NoSuchProcess:
+                self._proc_cache.pop(pid, None)
+                self._cpu_cache.pop(pid, None)
+                continue
+        
+        return processes
+
+
 class MonitoringPage(BasePage):
     """Performance monitoring page."""
+
+    # Plain-text usage label (colour and weight come from the label's QSS)
+    DISK_USAGE_TEMPLATE = "%.1f%% Used"
+
     def __init__(self):
         super().__init__("Performance Monitoring (Live)")
         
-        self.last_io_counters = psutil.disk_io_counters()
-        self.last_update_time = time.time()
-        
         main_gauges_layout = QHBoxLayout()
         main_gauges_layout.setSpacing(40)
 
+        # Values come from SystemStatsWorker.GAUGE_FUNCS under the same keys
         self.gauges = {
-            "CPU": {"widget": CircularProgressBar("CPU Usage", "#3498db", "#2ecc71"), 
-                    "psutil_func": lambda: psutil.cpu_percent(interval=0.1)}, 
+            "CPU": {"widget": CircularProgressBar("CPU Usage", "#3498db", "#2ecc71")}, 
             
-            "Memory": {"widget": CircularProgressBar("Memory", "#f1c40f", "#e67e22"), 
-                       "psutil_func": lambda: psutil.virtual_memory().percent},
+            "Memory": {"widget": CircularProgressBar("Memory", "#f1c40f", "#e67e22")},
             
-            "Net": {"widget": CircularProgressBar("Net Send (Mbps - Sim)", "#9b59b6", "#8e44ad"),
-                         "psutil_func": lambda: random.uniform(25, 75)},
+            "Net": {"widget": CircularProgressBar("Net Send (Mbps - Sim)", "#9b59b6", "#8e44ad")},
         }
         
         for item in self.gauges.values():
@@ -1155,13 +2221,25 @@ class MonitoringPage(BasePage):
 
         self.layout.addStretch()
         
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._update_monitoring_data)
-        self.timer.start(1500)
+        # psutil calls (disk and memory probes) run on a worker thread
+        self.stats_worker = SystemStatsWorker(self.disk_widgets.keys(), interval_ms=1500, parent=self)
+        self.stats_worker.stats_ready.connect(self._apply_stats)
+        QApplication.instance().aboutToQuit.connect(self.stats_worker.stop)
+        
+        # The worker only runs while the page is visible (showEvent/hideEvent)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.stats_worker.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.stats_worker.request_stop()
 
     def _setup_disk_usage_widgets(self):
         """Creates labels for all detected partitions."""
         self.disk_widgets = {}
+        self._disk_shown = {}  # mountpoint -> usage currently on its label
         try:
             partitions = psutil.disk_partitions(all=False)
             
@@ -1176,7 +2254,7 @@ class MonitoringPage(BasePage):
                 label = self._create_info_label(f"{p.device} ({p.mountpoint}): ")
                 hbox.addWidget(label, 1)
                 
-                usage_label = self._create_info_label("N/A")
+                usage_label = self._create_info_label("N/A", color="#2ecc71", bold=True)
                 hbox.addWidget(usage_label, 0, Qt.AlignmentFlag.AlignRight)
                 
                 self.disk_layout.addLayout(hbox)
@@ -1186,45 +2264,31 @@ class MonitoringPage(BasePage):
             error_label = self._create_info_label(f"Error listing disks: {e}")
             self.disk_layout.addWidget(error_label)
 
-    def _update_monitoring_data(self):
-        """Fetches real data and updates all metrics."""
+    def _apply_stats(self, stats):
+        """Applies a sample emitted by the stats worker to all metrics."""
         
         for key, item in self.gauges.items():
-            try:
-                value = item["psutil_func"]()
-                item["widget"].setValue(value)
-            except Exception:
-                item["widget"].setValue(0)
+            item["widget"].setValue(stats.get(key, 0))
 
-        try:
-            freq = psutil.cpu_freq()
-            self.cpu_freq_label.setText(f"{freq.current / 1000:.2f} / {freq.max / 1000:.2f} GHz")
-        except Exception:
+        freq = stats['cpu_freq']
+        if freq:
+            self.cpu_freq_label.setText(f"{freq[0] / 1000:.2f} / {freq[1] / 1000:.2f} GHz")
+        else:
             self.cpu_freq_label.setText("N/A")
 
-        current_io_counters = psutil.disk_io_counters()
-        current_time = time.time()
-        time_delta = current_time - self.last_update_time
-        
-        if self.last_io_counters and time_delta > 0:
-            read_rate_bytes = (current_io_counters.read_bytes - self.last_io_counters.read_bytes) / time_delta
-            write_rate_bytes = (current_io_counters.write_bytes - self.last_io_counters.write_bytes) / time_delta
-            
-            read_rate_mb = read_rate_bytes / (1024 * 1024)
-            write_rate_mb = write_rate_bytes / (1024 * 1024)
-            
+        if stats['disk_rates']:
+            read_rate_mb, write_rate_mb = stats['disk_rates']
             self.disk_read_label.setText(f"{read_rate_mb:.2f} MB/s")
             self.disk_write_label.setText(f"{write_rate_mb:.2f} MB/s")
 
-        self.last_io_counters = current_io_counters
-        self.last_update_time = current_time
-
-        for mountpoint, label in self.disk_widgets.items():
-            try:
-                usage = psutil.disk_usage(mountpoint).percent
-                label.setText(f"<b style='color: #2ecc71;'>{usage:.1f}%</b> Used")
-            except Exception:
-                label.setText("Unavailable")
+        for mountpoint, usage in stats['disk_usage'].items():
+            label = self.disk_widgets.get(mountpoint)
+            # The worker rounds usage to 0.1%, so an equal value means the
+            # label already shows it (usage mostly holds steady between samples)
+            if label is None or (mountpoint in self._disk_shown and self._disk_shown[mountpoint] == usage):
+                continue
+            self._disk_shown[mountpoint] = usage
+            label.setText("Unavailable" if usage is None else self.DISK_USAGE_TEMPLATE % usage)
 
 
 class GpuPage(BasePage):
@@ -1257,7 +2321,7 @@ class GpuPage(BasePage):
         info_grid.addWidget(self.model_label, 0, 1)
         
         info_grid.addWidget(QLabel("<b style='color: #bdc3c7;'>VRAM Used/Total (MB):</b>"), 1, 0)
-        self.vram_label = self._create_info_label("N/A")
+        self.vram_label = self._create_info_label("N/A", color="#2ecc71")
         info_grid.addWidget(self.vram_label, 1, 1)
 
         info_grid.addWidget(QLabel("<b style='color: #bdc3c7;'>Graphics Clock (MHz):</b>"), 2, 0)
@@ -1269,7 +2333,7 @@ class GpuPage(BasePage):
         info_grid.addWidget(self.mem_clock_label, 3, 1)
         
         info_grid.addWidget(QLabel("<b style='color: #bdc3c7;'>Power Draw (W):</b>"), 4, 0)
-        self.power_draw_label = self._create_info_label("N/A")
+        self.power_draw_label = self._create_info_label("N/A", color="#e74c3c", bold=True)
         info_grid.addWidget(self.power_draw_label, 4, 1)
         
         self.layout.addWidget(detail_group)
@@ -1282,31 +2346,39 @@ class GpuPage(BasePage):
         
         self.layout.addStretch()
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._update_gpu_data)
-        self.timer.start(2000) 
-
-    def _update_gpu_data(self):
-        """Fetches GPU live monitoring data."""
-        if not self.has_monitoring:
-            return
-
+        # Vendor library calls can stall, so polling runs on a worker thread
+        self.stats_worker = None
+        if self.has_monitoring:
+            self.stats_worker = GpuStatsWorker(gpu_detector, interval_ms=2000, parent=self)
+            self.stats_worker.stats_ready.connect(self._update_gpu_data)
+            QApplication.instance().aboutToQuit.connect(self.stats_worker.stop)
+            # Started and stopped with the page's visibility
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.stats_worker:
+            self.stats_worker.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self.stats_worker:
+            self.stats_worker.request_stop()
+
+    def _update_gpu_data(self, stats):
+        """Applies a live GPU sample emitted by the stats worker."""
         try:
-            stats = gpu_detector.get_live_stats()
-            
             gpu_load = stats['load']
             self.gpu_usage_gauge.setValue(int(gpu_load))
 
             temp_val = stats['temp']
             temp_percent = int(min(temp_val, 90) / 90 * 100) 
             self.gpu_temp_gauge.setValue(temp_percent)
-            self.gpu_temp_gauge.title = f"GPU Temp ({temp_val}°C)"
-            self.gpu_temp_gauge.update()
+            self.gpu_temp_gauge.setTitle(f"GPU Temp ({temp_val}°C)")
             
             vram_used = stats['vram_used']
             vram_total = stats['vram_total']
             if vram_total > 0:
-                self.vram_label.setText(f"<b style='color: #2ecc71;'>{vram_used} MB</b> / {vram_total} MB")
+                self.vram_label.setText(f"{vram_used} MB / {vram_total} MB")
             else:
                 self.vram_label.setText("N/A")
             
@@ -1321,7 +2393,7 @@ class GpuPage(BasePage):
                 self.mem_clock_label.setText("N/A")
             
             if stats['power'] > 0:
-                self.power_draw_label.setText(f"<b style='color: #e74c3c;'>{stats['power']:.2f} W</b>")
+                self.power_draw_label.setText(f"{stats['power']:.2f} W")
             else:
                 self.power_draw_label.setText("N/A")
             
@@ -1329,8 +2401,171 @@ class GpuPage(BasePage):
             print(f"Error fetching GPU stats: {e}")
 
 
+# --- Process Table Model ---
+
+# Foreground brushes for the threshold colours; data() hands out these shared
+# instances instead of parsing a colour string per cell
+_RED_BRUSH = QBrush(QColor("#e74c3c"))
+_ORANGE_BRUSH = QBrush(QColor("#f39c12"))
+_GREEN_BRUSH = QBrush(QColor("#2ecc71"))
+_BLUE_BRUSH = QBrush(QColor("#3498db"))
+_GRAY_BRUSH = QBrush(QColor("#95a5a6"))
+
+# Threshold colouring: bisect_left(thresholds, value) picks the brush, so a
+# value above the last threshold is red, above the first orange, else green
+_LOAD_BRUSHES = (_GREEN_BRUSH, _ORANGE_BRUSH, _RED_BRUSH)
+_CPU_THRESHOLDS = (20, 50)
+_MEMORY_THRESHOLDS = (5, 10)
+_STATUS_BRUSHES = {'running': _GREEN_BRUSH, 'sleeping': _BLUE_BRUSH}
+
+
+class ProcessTableModel(QAbstractTableModel):
+    """
+    Serves the process list to a QTableView. The view only asks data() for
+    the cells it paints, so a refresh costs no per-cell objects; the two
+    action columns carry no data and are painted by an ActionDelegate.
+    """
+    HEADERS = ("PID", "Name", "CPU %", "Memory %", "Status", "Kill", "Priority")
+    DATA_COLUMNS = 5
+
+    _CHANGED_ROLES = [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        # Per row, the DisplayRole text and ForegroundRole brush of each column
+        self._texts = []
+        self._foregrounds = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.column() >= self.DATA_COLUMNS:
+            return None
+        
+        # Both are resolved once per scan in set_rows, not on every repaint
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._texts[index.row()][index.column()]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._foregrounds[index.row()][index.column()]
+        return None
+
+    @staticmethod
+    def _row_texts(proc):
+        """Display text of a row's columns."""
+        # Unpacking is cheaper than attribute access on the namedtuple
+        pid, name, cpu, memory, status = proc
+        return (str(pid), name or "", f"{cpu:.1f}%", f"{memory:.1f}%", status or "")
+
+    @staticmethod
+    def _row_foregrounds(proc):
+        """Foreground brushes of a row's columns (PID and Name use the table's colour)."""
+        return (
+            None,
+            None,
+            _LOAD_BRUSHES[bisect.bisect_left(_CPU_THRESHOLDS, proc.cpu)],
+            _LOAD_BRUSHES[bisect.bisect_left(_MEMORY_THRESHOLDS, proc.memory)],
+            _STATUS_BRUSHES.get(proc.status, _GRAY_BRUSH),
+        )
+
+    def row_at(self, row):
+        """Returns the ProcRow shown on row."""
+        return self._rows[row]
+
+    def set_rows(self, rows):
+        """
+        Replaces the process list. Rows are only inserted or removed at the
+        end, so the view never has to re-lay out the rows that stay, and
+        dataChanged only covers the cells of kept rows whose text or colour differs.
+        """
+        old_texts, old_foregrounds = self._texts, self._foregrounds
+        old_count, new_count = len(self._rows), len(rows)
+        texts = [self._row_texts(proc) for proc in rows]
+        foregrounds = [self._row_foregrounds(proc) for proc in rows]
+        if new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._rows, self._texts, self._foregrounds = rows, texts, foregrounds
+            self.endInsertRows()
+        elif new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._rows, self._texts, self._foregrounds = rows, texts, foregrounds
+            self.endRemoveRows()
+        else:
+            self._rows, self._texts, self._foregrounds = rows, texts, foregrounds
+        
+        # A process usually sits on the same row from one scan to the next with
+        # only its CPU/memory text changing; consecutive changed rows share one
+        # dataChanged spanning the columns that changed in any of them
+        run_start = first_col = last_col = None
+        for row in range(min(old_count, new_count) + 1):
+            changed = [] if row == min(old_count, new_count) else [
+                col for col in range(self.DATA_COLUMNS)
+                if texts[row][col] != old_texts[row][col] or foregrounds[row][col] is not old_foregrounds[row][col]
+            ]
+            if changed:
+                if run_start is None:
+                    run_start, first_col, last_col = row, changed[0], changed[-1]
+                else:
+                    first_col, last_col = min(first_col, changed[0]), max(last_col, changed[-1])
+            elif run_start is not None:
+                self.dataChanged.emit(self.index(run_start, first_col), self.index(row - 1, last_col), self._CHANGED_ROLES)
+                run_start = None
+
+
+class ActionDelegate(QStyledItemDelegate):
+    """
+    Paints a push button in every cell of a column and emits clicked(row) when
+    it is clicked, so the table needs no QPushButton widget (and connection)
+    per row.
+    """
+    clicked = pyqtSignal(int)
+
+    _MARGIN = 3
+    _RADIUS = 5
+
+    def __init__(self, text, color, hover_color, parent=None):
+        super().__init__(parent)
+        self.text = text
+        self.color = QColor(color)
+        self.hover_color = QColor(hover_color)
+        self._font = QFont()
+        self._font.setBold(True)
+
+    def paint(self, painter, option, index):
+        rect = option.rect.adjusted(self._MARGIN, self._MARGIN, -self._MARGIN, -self._MARGIN)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.hover_color if hovered else self.color)
+        painter.drawRoundedRect(QRectF(rect), self._RADIUS, self._RADIUS)
+        painter.setPen(Qt.GlobalColor.white)
+        painter.setFont(self._font)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.text)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            self.clicked.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
 class AppsServicesPage(BasePage):
     """Apps and services control page with real process management."""
+
     def __init__(self):
         super().__init__("Apps & Services Control")
         
@@ -1390,23 +2625,33 @@ class AppsServicesPage(BasePage):
         self.layout.addSpacing(10)
         
         # Process table
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels(["PID", "Name", "CPU %", "Memory %", "Status", "Kill", "Priority"])
+        self.model = ProcessTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        # The Kill/Set Priority buttons are painted; they act on whichever process is on the clicked row
+        self.kill_delegate = ActionDelegate("Kill", "#e74c3c", "#c0392b", self.table)
+        self.kill_delegate.clicked.connect(lambda row: self._kill_process(self.model.row_at(row).pid))
+        self.priority_delegate = ActionDelegate("Set Priority", "#3498db", "#2980b9", self.table)
+        self.priority_delegate.clicked.connect(lambda row: self._set_priority(self.model.row_at(row).pid, self.model.row_at(row).name))
+        self.table.setItemDelegateForColumn(5, self.kill_delegate)
+        self.table.setItemDelegateForColumn(6, self.priority_delegate)
+        self.table.setMouseTracking(True)  # Hover highlight on the painted buttons
         self.table.verticalHeader().setVisible(False)
+        # Every row has the same height, so rows are never measured against their contents
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.table.horizontalHeader().setStyleSheet(
             "QHeaderView::section { background-color: #34495e; color: #ecf0f1; padding: 8px; border: none; font-weight: bold; }"
         )
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.table.setStyleSheet("""
-            QTableWidget { 
+            QTableView { 
                 background-color: #34495e; 
                 color: #ecf0f1; 
                 border: none; 
                 gridline-color: #2c3e50;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #2ecc71;
                 color: #2c3e50;
             }
@@ -1437,153 +2682,54 @@ class AppsServicesPage(BasePage):
         self.filter_high_mem_btn.clicked.connect(lambda: self._load_processes("memory"))
         self.refresh_btn.clicked.connect(lambda: self._load_processes(self.current_filter))
         
-        # Initial load
+        # Processes are enumerated on a worker thread (every 5 seconds, only
+        # while visible; it scans right away when started or woken)
         self.current_filter = "all"
-        self._load_processes("all")
-        
-        # Auto-refresh timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(lambda: self._load_processes(self.current_filter, silent=True))
-        self.timer.start(5000)  # Refresh every 5 seconds
+        self.scanner = ProcessScanner(interval_ms=5000, parent=self)
+        self.scanner.stats_ready.connect(self._apply_processes)
+        QApplication.instance().aboutToQuit.connect(self.scanner.stop)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.scanner.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.scanner.request_stop()
 
     def _load_processes(self, filter_type="all", silent=False):
-        """Load and display processes based on filter type."""
+        """Load and display processes based on filter type (the scan runs on the scanner thread)."""
         self.current_filter = filter_type
         
         if not silent:
             self.status_label.setText("Loading processes...")
         
-        try:
-            processes = []
-            
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status', 'username']):
-                try:
-                    info = proc.info
-                    
-                    # Apply filters
-                    if filter_type == "user":
-                        # Try to filter out system processes
-                        if platform.system() == 'Windows':
-                            if info['username'] and 'SYSTEM' in info['username'].upper():
-                                continue
-                        else:
-                            if info['username'] in ['root', 'daemon', 'sys']:
-                                continue
-                    
-                    elif filter_type == "cpu":
-                        if info['cpu_percent'] < 5.0:  # Show only >5% CPU
-                            continue
-                    
-                    elif filter_type == "memory":
-                        if info['memory_percent'] < 1.0:  # Show only >1% Memory
-                            continue
-                    
-                    processes.append({
-                        'pid': info['pid'],
-                        'name': info['name'],
-                        'cpu': info['cpu_percent'] or 0,
-                        'memory': info['memory_percent'] or 0,
-                        'status': info['status']
-                    })
-                
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
-            
-            # Sort by memory usage (descending)
-            if filter_type == "cpu":
-                processes.sort(key=lambda x: x['cpu'], reverse=True)
-            else:
-                processes.sort(key=lambda x: x['memory'], reverse=True)
-            
-            # Limit to top 50 for performance
-            processes = processes[:50]
-            
-            # Update table
-            self.table.setRowCount(len(processes))
-            
-            for row, proc in enumerate(processes):
-                # PID
-                pid_item = QTableWidgetItem(str(proc['pid']))
-                self.table.setItem(row, 0, pid_item)
-                
-                # Name
-                name_item = QTableWidgetItem(proc['name'])
-                self.table.setItem(row, 1, name_item)
-                
-                # CPU %
-                cpu_item = QTableWidgetItem(f"{proc['cpu']:.1f}%")
-                if proc['cpu'] > 50:
-                    cpu_item.setForeground(QColor("#e74c3c"))
-                elif proc['cpu'] > 20:
-                    cpu_item.setForeground(QColor("#f39c12"))
-                else:
-                    cpu_item.setForeground(QColor("#2ecc71"))
-                self.table.setItem(row, 2, cpu_item)
-                
-                # Memory %
-                mem_item = QTableWidgetItem(f"{proc['memory']:.1f}%")
-                if proc['memory'] > 10:
-                    mem_item.setForeground(QColor("#e74c3c"))
-                elif proc['memory'] > 5:
-                    mem_item.setForeground(QColor("#f39c12"))
-                else:
-                    mem_item.setForeground(QColor("#2ecc71"))
-                self.table.setItem(row, 3, mem_item)
-                
-                # Status
-                status_item = QTableWidgetItem(proc['status'])
-                if proc['status'] == 'running':
-                    status_item.setForeground(QColor("#2ecc71"))
-                elif proc['status'] == 'sleeping':
-                    status_item.setForeground(QColor("#3498db"))
-                else:
-                    status_item.setForeground(QColor("#95a5a6"))
-                self.table.setItem(row, 4, status_item)
-                
-                # Kill Button
-                kill_btn = QPushButton("Kill")
-                kill_btn.setStyleSheet("""
-                    QPushButton { 
-                        background-color: #e74c3c; 
-                        color: white; 
-                        padding: 5px; 
-                        border-radius: 5px;
-                        font-weight: bold;
-                    } 
-                    QPushButton:hover { 
-                        background-color: #c0392b; 
-                    }
-                """)
-                kill_btn.clicked.connect(lambda checked, p=proc['pid']: self._kill_process(p))
-                self.table.setCellWidget(row, 5, kill_btn)
-                
-                # Priority Button
-                priority_btn = QPushButton("Set Priority")
-                priority_btn.setStyleSheet("""
-                    QPushButton { 
-                        background-color: #3498db; 
-                        color: white; 
-                        padding: 5px; 
-                        border-radius: 5px;
-                        font-weight: bold;
-                    } 
-                    QPushButton:hover { 
-                        background-color: #2980b9; 
-                    }
-                """)
-                priority_btn.clicked.connect(lambda checked, p=proc['pid'], n=proc['name']: self._set_priority(p, n))
-                self.table.setCellWidget(row, 6, priority_btn)
-            
-            self.status_label.setText(f"Showing {len(processes)} processes ({filter_type} filter)")
+        self.scanner.filter_type = filter_type
+        self.scanner.sample_now()
+
+    def _apply_processes(self, result):
+        """Shows a scan emitted by the process scanner."""
+        if result['filter'] != self.current_filter:
+            return  # Scanned before the filter changed; the rescan is already queued
         
-        except Exception as e:
-            self.status_label.setText(f"Error loading processes: {e}")
-            print(f"Error in _load_processes: {e}")
+        if result['error'] is not None:
+            self.status_label.setText(f"Error loading processes: {result['error']}")
+            print(f"Error in ProcessScanner: {result['error']}")
+            return
+        
+        processes = result['processes']
+        # Row inserts and cell changes repaint once, at the end
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.set_rows(processes)
+        finally:
+            self.table.setUpdatesEnabled(True)
+        self.status_label.setText(f"Showing {len(processes)} processes ({result['filter']} filter)")
 
     def _kill_process(self, pid):
         """Kill a process by PID."""
         try:
-            proc = psutil.Process(pid)
+            proc = self.scanner.get_process(pid)
             proc_name = proc.name()
             
             reply = QMessageBox.question(
@@ -1612,7 +2758,7 @@ class AppsServicesPage(BasePage):
     def _set_priority(self, pid, name):
         """Set process priority."""
         try:
-            proc = psutil.Process(pid)
+            proc = self.scanner.get_process(pid)
             
             # Create priority selection dialog
             dialog = QMessageBox(self)
@@ -1620,7 +2766,7 @@ class AppsServicesPage(BasePage):
             dialog.setText(f"Set priority for:\n{name} (PID: {pid})")
             
             # Platform-specific priority options
-            if platform.system() == 'Windows':
+            if SYSTEM == 'Windows':
                 priorities = {
                     "Realtime": psutil.REALTIME_PRIORITY_CLASS,
                     "High": psutil.HIGH_PRIORITY_CLASS,
@@ -1653,7 +2799,7 @@ class AppsServicesPage(BasePage):
             if clicked != cancel_btn and clicked in buttons:
                 priority_value = buttons[clicked]
                 
-                if platform.system() == 'Windows':
+                if SYSTEM == 'Windows':
                     proc.nice(priority_value)
                 else:
                     proc.nice(priority_value)
@@ -1669,8 +2815,68 @@ class AppsServicesPage(BasePage):
             QMessageBox.critical(self, "Error", f"Failed to set priority: {e}")
 
 
+def _win32_call(dll_name, func_name, restype, argtypes=(), args=()):
+    """
+    Calls a Win32 API that returns a success flag directly through ctypes,
+    which saves spawning rundll32.exe. Returns False if the call failed or is
+    unavailable so the caller can fall back to the command line.
+    """
+    try:
+        func = getattr(getattr(ctypes.windll, dll_name), func_name)
+        # Without a prototype ctypes reads the result as an int, so a 1-byte
+        # BOOLEAN would pick up whatever the upper bytes of the register hold
+        func.restype = restype
+        func.argtypes = argtypes
+        return bool(func(*args))
+    except (AttributeError, OSError):
+        return False
+
+
 class ControlPage(BasePage):
     """System control page with real power management."""
+
+    # (action, OS) -> commands tried in order until one succeeds. A callable
+    # entry is a direct API call that returns True on success; the table is
+    # looked up once per click instead of walking an if/elif tree.
+    _CONTROL_COMMANDS = {
+        ("shutdown", "Windows"): (["shutdown", "/s", "/t", "0"],),
+        ("shutdown", "Linux"): (["systemctl", "poweroff"],),
+        ("shutdown", "Darwin"): (["sudo", "shutdown", "-h", "now"],),
+        
+        ("reboot", "Windows"): (["shutdown", "/r", "/t", "0"],),
+        ("reboot", "Linux"): (["systemctl", "reboot"],),
+        ("reboot", "Darwin"): (["sudo", "shutdown", "-r", "now"],),
+        
+        ("sleep", "Windows"): (
+            lambda: _win32_call("powrprof", "SetSuspendState", wintypes.BOOLEAN,
+                                (wintypes.BOOLEAN, wintypes.BOOLEAN, wintypes.BOOLEAN), (0, 1, 0)),
+            ["rundll32.exe", "powrprof.dll,SetSuspendState", "0,1,0"],
+        ),
+        ("sleep", "Linux"): (["systemctl", "suspend"],),
+        ("sleep", "Darwin"): (["pmset", "sleepnow"],),
+        
+        ("logoff", "Windows"): (["shutdown", "/l"],),
+        ("logoff", "Linux"): (
+            ["loginctl", "terminate-user", USER],
+            ["pkill", "-KILL", "-u", USER],
+        ),
+        ("logoff", "Darwin"): (["osascript", "-e", 'tell application "System Events" to log out'],),
+        
+        ("lock", "Windows"): (
+            lambda: _win32_call("user32", "LockWorkStation", wintypes.BOOL),
+            ["rundll32.exe", "user32.dll,LockWorkStation"],
+        ),
+        ("lock", "Linux"): (
+            ["loginctl", "lock-session"],
+            ["xdg-screensaver", "lock"],
+            ["gnome-screensaver-command", "-l"],
+            ["dm-tool", "lock"],
+        ),
+        ("lock", "Darwin"): (["/System/Library/CoreServices/Menu Extras/User.menu/Contents/Resources/CGSession", "-suspend"],),
+    }
+    # Screen lockers may hang when no session answers
+    _CONTROL_TIMEOUTS = {"lock": 2}
+
     def __init__(self):
         super().__init__("System Control")
         
@@ -1732,8 +2938,8 @@ class ControlPage(BasePage):
         info_layout.setContentsMargins(20, 30, 20, 20)
         
         self.uptime_label = self._create_info_label("N/A")
-        self.user_label = self._create_info_label("N/A")
-        self.hostname_label = self._create_info_label("N/A")
+        self.user_label = self._create_info_label(USER)
+        self.hostname_label = self._create_info_label(HOSTNAME)
         
         info_layout.addWidget(QLabel("<b style='color: #bdc3c7;'>System Uptime:</b>"), 0, 0)
         info_layout.addWidget(self.uptime_label, 0, 1)
@@ -1748,55 +2954,40 @@ class ControlPage(BasePage):
         
         self.layout.addStretch()
         
-        # Update system info
-        self._update_system_info()
-        
         # Timer to update system info
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._update_system_info)
-        self.timer.start(60000)  # Update every minute
+        self.timer.setInterval(60000)  # Update every minute, only while visible
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Refresh right away: the uptime may be stale from before the page was hidden
+        self._update_system_info()
+        self.timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
 
     def _add_control_button(self, layout, text, color, action, description):
         """Add a styled control button."""
         btn = QPushButton(text)
         btn.setFont(QFont("Inter", 14, QFont.Weight.DemiBold)) 
         btn.setFixedSize(QSize(160, 80))
-        hover_color = QColor(color).darker(120).name()
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_color}; 
-            }}
-            QPushButton:pressed {{
-                background-color: {QColor(color).darker(150).name()};
-            }}
-        """)
+        btn.setStyleSheet(_CONTROL_BUTTON_QSS % {
+            'base': color,
+            'hover': _shade(color, 120, 'darker'),
+            'pressed': _shade(color, 150, 'darker'),
+        })
         btn.clicked.connect(lambda: self._execute_control(action, text, description))
         layout.addWidget(btn, alignment=Qt.AlignmentFlag.AlignCenter)
 
     def _update_system_info(self):
-        """Update system information display."""
+        """Update system information display (user and hostname are fixed at startup)."""
         try:
             # Uptime
-            boot_time = psutil.boot_time()
-            uptime_seconds = time.time() - boot_time
-            days = int(uptime_seconds // (24 * 3600))
-            hours = int((uptime_seconds % (24 * 3600)) // 3600)
-            minutes = int((uptime_seconds % 3600) // 60)
-            self.uptime_label.setText(f"{days}d {hours}h {minutes}m")
-            
-            # Current user
-            import getpass
-            self.user_label.setText(getpass.getuser())
-            
-            # Hostname
-            self.hostname_label.setText(platform.node())
+            uptime = _uptime_parts()
+            self.uptime_label.setText("%dd %dh %dm" % uptime if uptime else "N/A")
         
         except Exception as e:
             print(f"Error updating system info: {e}")
@@ -1819,63 +3010,20 @@ class ControlPage(BasePage):
             return
         
         try:
-            system = platform.system()
-            
-            if action == "shutdown":
-                if system == "Windows":
-                    subprocess.run(["shutdown", "/s", "/t", "0"], check=True)
-                elif system == "Linux":
-                    subprocess.run(["systemctl", "poweroff"], check=True)
-                elif system == "Darwin":
-                    subprocess.run(["sudo", "shutdown", "-h", "now"], check=True)
-            
-            elif action == "reboot":
-                if system == "Windows":
-                    subprocess.run(["shutdown", "/r", "/t", "0"], check=True)
-                elif system == "Linux":
-                    subprocess.run(["systemctl", "reboot"], check=True)
-                elif system == "Darwin":
-                    subprocess.run(["sudo", "shutdown", "-r", "now"], check=True)
-            
-            elif action == "sleep":
-                if system == "Windows":
-                    subprocess.run(["rundll32.exe", "powrprof.dll,SetSuspendState", "0,1,0"], check=True)
-                elif system == "Linux":
-                    subprocess.run(["systemctl", "suspend"], check=True)
-                elif system == "Darwin":
-                    subprocess.run(["pmset", "sleepnow"], check=True)
-            
-            elif action == "logoff":
-                if system == "Windows":
-                    subprocess.run(["shutdown", "/l"], check=True)
-                elif system == "Linux":
-                    # Try multiple methods
-                    try:
-                        subprocess.run(["loginctl", "terminate-user", getpass.getuser()], check=True)
-                    except:
-                        subprocess.run(["pkill", "-KILL", "-u", getpass.getuser()], check=True)
-                elif system == "Darwin":
-                    subprocess.run(["osascript", "-e", 'tell application "System Events" to log out'], check=True)
-            
-            elif action == "lock":
-                if system == "Windows":
-                    subprocess.run(["rundll32.exe", "user32.dll,LockWorkStation"], check=True)
-                elif system == "Linux":
-                    # Try multiple lock commands
-                    lock_commands = [
-                        ["loginctl", "lock-session"],
-                        ["xdg-screensaver", "lock"],
-                        ["gnome-screensaver-command", "-l"],
-                        ["dm-tool", "lock"]
-                    ]
-                    for cmd in lock_commands:
-                        try:
-                            subprocess.run(cmd, check=True, timeout=2)
-                            break
-                        except:
-                            continue
-                elif system == "Darwin":
-                    subprocess.run(["/System/Library/CoreServices/Menu Extras/User.menu/Contents/Resources/CGSession", "-suspend"], check=True)
+            # Alternatives are tried in order; failures only surface from the last one
+            commands = self._CONTROL_COMMANDS.get((action, SYSTEM), ())
+            timeout = self._CONTROL_TIMEOUTS.get(action)
+            for i, cmd in enumerate(commands):
+                if callable(cmd):
+                    if cmd():
+                        break
+                    continue
+                try:
+                    subprocess.run(cmd, check=True, timeout=timeout)
+                    break
+                except Exception:
+                    if i == len(commands) - 1:
+                        raise
         
         except subprocess.CalledProcessError as e:
             QMessageBox.critical(self, "Error", f"Failed to execute {action}: {e}")
@@ -1897,6 +3045,7 @@ class SystemDashboard(QMainWindow):
         
         self.target_monitor = target_monitor
         self.giphy_api_key = giphy_api_key  # Store the API key
+        self.network_manager = get_network_manager()  # One manager for every page
         
         self.setWindowFlags(Qt.WindowType.Tool | Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint) # hide from taskbar
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
@@ -1975,13 +3124,14 @@ class SystemDashboard(QMainWindow):
             self.sidebar.addItem(item)
             
     def _setup_content_stack(self):
-        self.content_stack.addWidget(SystemInfoPage())
         self.content_stack.addWidget(MonitoringPage())
         self.content_stack.addWidget(GpuPage())
         self.content_stack.addWidget(AppsServicesPage())
         self.content_stack.addWidget(ControlPage())
-        self.content_stack.addWidget(GifPage())
-        self.content_stack.addWidget(GifPage(self.giphy_api_key))  # Pass API key
+        self.content_stack.addWidget(GifPage(self.giphy_api_key, network_manager=self.network_manager))  # Pass API key
+        # Built last so the static info probe started at startup has had the
+        # most time to finish on the thread pool
+        self.content_stack.insertWidget(0, SystemInfoPage())
 
     def keyPressEvent(self, event):
         """Handle the Escape key press to close the window."""
@@ -2015,12 +3165,6 @@ if __name__ == "__main__":
 
     if not target_monitor:
         QMessageBox.critical(None, "Error", "Failed to find any monitor to display the application.")
-        
-        if NVML_AVAILABLE and gpu_detector.nvml_handle:
-            try:
-                nvmlShutdown()
-            except:
-                pass
         sys.exit(1)
 
     print(f"--- 2. Launching App on Target Monitor...")
@@ -2028,6 +3172,9 @@ if __name__ == "__main__":
 
     app = QApplication(sys.argv)
     
+    # Warm the static system info (cpuinfo, WMI) while the window is built
+    QThreadPool.globalInstance().start(_static_system_info)
+    
     # Pass settings to the window
     window = SystemDashboard(target_monitor, config_resolution, giphy_api_key)
    
@@ -2045,10 +3192,5 @@ if __name__ == "__main__":
     
     exit_code = app.exec()
     
-    if NVML_AVAILABLE and gpu_detector.nvml_handle:
-        try:
-            nvmlShutdown()
-        except:
-            pass
-
+    # NVML is shut down by the atexit hook registered at detection
     sys.exit(exit_code)
\ No newline at end of file